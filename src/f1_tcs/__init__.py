@@ -6,7 +6,6 @@
 
 from __future__ import annotations
 
-import logging
 import pathlib
 
 from yaml import safe_load
@@ -26,12 +25,11 @@ def load_config() -> dict:
 
 config = load_config()
 
-logger = logging.getLogger("uvicorn.error")
 
-# Log debug messages.
-logger.setLevel(logging.DEBUG)
-for handler in logger.handlers:
-    handler.setLevel(logging.DEBUG)
+from .log import setup_logging
+
+
+logger, timing_logger = setup_logging(**config.get("logging", {}))
 
 
 __all__ = ["config"]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: admission.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from typing import Any, AsyncIterator, Literal
+
+from f1_tcs import config
+
+
+__all__ = ["AdmissionController", "AdmissionRejected", "RouteClass"]
+
+
+RouteClass = Literal["read", "motion", "safety"]
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted."""
+
+    def __init__(self, message: str, retry_after: float):
+        self.retry_after = retry_after
+
+        super().__init__(message)
+
+
+class _Gate:
+    """Bounded concurrency for a route class.
+
+    Parameters
+    ----------
+    max_concurrency
+        Maximum number of requests running at the same time. If ``None``, all
+        requests are admitted immediately.
+    max_queue
+        Maximum number of requests waiting for a slot.
+    max_wait
+        Maximum estimated wait, in seconds, for a request to be admitted.
+    service_time
+        Initial estimate of the time, in seconds, that each request holds its
+        slot. Used until requests have completed and updated the estimate.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        max_wait: float | None = None,
+        service_time: float = 0.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        self._semaphore: asyncio.Semaphore | None = None
+        if max_concurrency is not None:
+            self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.active: int = 0
+        self.waiting: int = 0
+        self.n_admitted: int = 0
+        self.n_rejected: int = 0
+
+        # Exponentially weighted moving average of the time each request holds
+        # its slot. Used to estimate the wait of new requests.
+        self.service_time: float = service_time
+
+    def estimated_wait(self) -> float:
+        """Estimates how long a new request would wait for a slot."""
+
+        if self.max_concurrency is None or self.active < self.max_concurrency:
+            return 0.0
+
+        return (self.waiting + 1) * self.service_time / self.max_concurrency
+
+    async def acquire(self):
+        """Waits for a slot or raises `.AdmissionRejected`."""
+
+        if self._semaphore is None:
+            self.active += 1
+            self.n_admitted += 1
+            return
+
+        estimated_wait = self.estimated_wait()
+
+        # The queue limit only applies if the request would need to wait.
+        full = self.max_concurrency is not None and self.active >= self.max_concurrency
+        if full and self.max_queue is not None and self.waiting >= self.max_queue:
+            self.n_rejected += 1
+            raise AdmissionRejected("Too many queued requests.", estimated_wait)
+
+        if self.max_wait is not None and estimated_wait > self.max_wait:
+            self.n_rejected += 1
+            raise AdmissionRejected("Estimated wait is too long.", estimated_wait)
+
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        self.n_admitted += 1
+
+    def release(self, service_time: float):
+        """Releases a slot."""
+
+        self.active -= 1
+        self.service_time = 0.8 * self.service_time + 0.2 * service_time
+
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class AdmissionController:
+    """Admission control for the requests to one of the backends.
+
+    Each route class has its own bounded concurrency, queue depth, and maximum
+    estimated wait. Requests over those limits are rejected immediately instead
+    of waiting until the backend times out. ``safety`` requests are always
+    admitted.
+
+    Parameters
+    ----------
+    limits
+        A mapping of route class to the keyword arguments for its limits
+        (``max_concurrency``, ``max_queue``, ``max_wait``, ``service_time``).
+
+    """
+
+    def __init__(self, limits: dict[str, dict[str, Any]] | None = None):
+        limits = limits or {}
+
+        self.gates: dict[str, _Gate] = {
+            route_class: _Gate(**limits.get(route_class, {}))
+            for route_class in ("read", "motion")
+        }
+        self.gates["safety"] = _Gate()
+
+    @classmethod
+    def from_config(cls, backend: str) -> AdmissionController:
+        """Creates a controller using the ``admission`` section of the configuration."""
+
+        return cls(config.get("admission", {}).get(backend, {}))
+
+    async def acquire(self, route_class: RouteClass) -> float:
+        """Waits for a slot. Returns the time at which the slot was acquired."""
+
+        await self.gates[route_class].acquire()
+
+        return time.perf_counter()
+
+    def release(self, route_class: RouteClass, acquired: float):
+        """Releases a slot acquired with `.acquire`."""
+
+        self.gates[route_class].release(time.perf_counter() - acquired)
+
+    @asynccontextmanager
+    async def admit(self, route_class: RouteClass) -> AsyncIterator[None]:
+        """Holds a slot for the duration of the context."""
+
+        acquired = await self.acquire(route_class)
+        try:
+            yield
+        finally:
+            self.release(route_class, acquired)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Returns the state of each route class."""
+
+        return {
+            route_class: {
+                "active": gate.active,
+                "waiting": gate.waiting,
+                "n_admitted": gate.n_admitted,
+                "n_rejected": gate.n_rejected,
+                "estimated_wait": gate.estimated_wait(),
+            }
+            for route_class, gate in self.gates.items()
+        }
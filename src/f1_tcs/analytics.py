@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: analytics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import functools
+import pathlib
+
+from typing import Any, Sequence
+
+import numpy
+from astropy.coordinates import angular_separation
+
+from f1_tcs.telemetry import COLUMNS, load_night
+from f1_tcs.tools import ScopeStatusMaskbit
+
+
+__all__ = ["get_night_events", "summarise", "find_runs", "SWITCH_BITS"]
+
+
+#: Mask bits for which the number of activations is reported.
+SWITCH_BITS: tuple[ScopeStatusMaskbit, ...] = (
+    ScopeStatusMaskbit.LIMIT_SWITCH_PRIMARY_PLUS,
+    ScopeStatusMaskbit.LIMIT_SWITCH_PRIMARY_MINUS,
+    ScopeStatusMaskbit.LIMIT_SWITCH_SECONDARY_PLUS,
+    ScopeStatusMaskbit.LIMIT_SWITCH_SECONDARY_MINUS,
+    ScopeStatusMaskbit.HOMING_SWITCH_PRIMARY_AXIS,
+    ScopeStatusMaskbit.HOMING_SWITCH_SECONDARY_AXIS,
+)
+
+#: Bits that, together with ``TRACKING``, exclude a sample from the drift analysis.
+NOT_SIDEREAL_BITS = (
+    ScopeStatusMaskbit.SLEWING
+    | ScopeStatusMaskbit.PARKING
+    | ScopeStatusMaskbit.PARKED
+    | ScopeStatusMaskbit.TRACKING_OFFSET_RATE
+    | ScopeStatusMaskbit.TRACKING_SATELLITE
+    | ScopeStatusMaskbit.TRACKING_UNSETTLED_AFTER_SLEW
+)
+
+COL = {name: index for index, name in enumerate(COLUMNS)}
+
+
+def find_runs(flag: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the start and end (exclusive) indices of the runs of ``True``."""
+
+    padded = numpy.concatenate(([0], flag.astype(numpy.int8), [0]))
+    edges = numpy.diff(padded)
+
+    return numpy.flatnonzero(edges == 1), numpy.flatnonzero(edges == -1)
+
+
+def _complete_runs(flag: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Like `.find_runs` but drops the runs cut by the start or end of the data."""
+
+    starts, ends = find_runs(flag)
+    complete = (starts > 0) & (ends < len(flag))
+
+    return starts[complete], ends[complete]
+
+
+def _night_events(data: numpy.ndarray) -> dict[str, numpy.ndarray]:
+    """Extracts the slews, settles, tracking segments, and switch activations."""
+
+    time = data[:, COL["time"]]
+    mask = data[:, COL["bool_params"]].astype(numpy.int64)
+
+    events: dict[str, numpy.ndarray] = {"n_samples": numpy.array([len(data)])}
+
+    # Slews. The duration goes from the first sample with SLEWING set to the first
+    # sample after the slew, and the distance from the position before the slew
+    # to the position after it.
+    starts, ends = _complete_runs((mask & ScopeStatusMaskbit.SLEWING) != 0)
+
+    alt = numpy.radians(data[:, COL["altitude"]])
+    az = numpy.radians(data[:, COL["azimuth"]])
+
+    events["slew_duration"] = time[ends] - time[starts]
+    events["slew_distance"] = numpy.degrees(
+        angular_separation(az[starts - 1], alt[starts - 1], az[ends], alt[ends])
+    )
+
+    # Settle time after a slew.
+    bit = ScopeStatusMaskbit.TRACKING_UNSETTLED_AFTER_SLEW
+    starts, ends = _complete_runs((mask & bit) != 0)
+    events["settle_duration"] = time[ends] - time[starts]
+
+    # Tracking drift, as the offset in RA and Dec (in arcsec) with respect to the
+    # first sample of each segment of continuous sidereal tracking.
+    tracking = ((mask & ScopeStatusMaskbit.TRACKING) != 0) & (
+        (mask & NOT_SIDEREAL_BITS) == 0
+    )
+    starts, ends = find_runs(tracking)
+
+    lengths = ends - starts
+    keep = lengths > 1
+    starts, ends, lengths = starts[keep], ends[keep], lengths[keep]
+
+    # For each sample in a segment, the segment number and the index of the sample
+    # and of the first sample of the segment in the data.
+    n_segments = len(starts)
+    offsets = numpy.cumsum(lengths) - lengths
+    last = offsets + lengths - 1
+
+    segment = numpy.repeat(numpy.arange(n_segments), lengths)
+    first = numpy.repeat(starts, lengths)
+    index = first + numpy.arange(lengths.sum()) - numpy.repeat(offsets, lengths)
+
+    ra = data[:, COL["right_ascension"]]
+    dec = data[:, COL["declination"]]
+
+    dra_hours = (ra[index] - ra[first] + 12) % 24 - 12
+    dra = dra_hours * 15 * 3600 * numpy.cos(numpy.radians(dec[index]))
+    ddec = (dec[index] - dec[first]) * 3600
+
+    events["tracking_n"] = lengths
+    events["tracking_duration"] = time[ends - 1] - time[starts]
+    events["tracking_sumsq_ra"] = numpy.bincount(segment, dra**2, n_segments)
+    events["tracking_sumsq_dec"] = numpy.bincount(segment, ddec**2, n_segments)
+    events["tracking_drift_ra"] = dra[last]
+    events["tracking_drift_dec"] = ddec[last]
+
+    if n_segments > 0:
+        events["tracking_max_ra"] = numpy.maximum.reduceat(numpy.abs(dra), offsets)
+        events["tracking_max_dec"] = numpy.maximum.reduceat(numpy.abs(ddec), offsets)
+    else:
+        events["tracking_max_ra"] = numpy.empty(0)
+        events["tracking_max_dec"] = numpy.empty(0)
+
+    # Number of times each switch was activated.
+    bits = numpy.array([int(bit) for bit in SWITCH_BITS])
+    active = (mask[:, None] & bits) != 0
+    events["switches"] = numpy.count_nonzero(active[1:] & ~active[:-1], axis=0)
+
+    return events
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_night_events(
+    file: str,
+    mtime_ns: int,
+    size: int,
+) -> dict[str, numpy.ndarray]:
+    """Computes the events of a night. Cached by file modification time and size."""
+
+    return _night_events(load_night(file))
+
+
+def get_night_events(file: str | pathlib.Path) -> dict[str, numpy.ndarray]:
+    """Returns the events for a night's telemetry file.
+
+    The results are cached and only recomputed if the file changes.
+
+    """
+
+    stat = pathlib.Path(file).stat()
+
+    return _cached_night_events(str(file), stat.st_mtime_ns, stat.st_size)
+
+
+def _stats(values: numpy.ndarray) -> dict[str, float | None]:
+    """Returns summary statistics for an array."""
+
+    if len(values) == 0:
+        return {"mean": None, "median": None, "p90": None, "max": None}
+
+    mean, median, p90, max_ = (
+        numpy.mean(values),
+        *numpy.percentile(values, [50, 90]),
+        numpy.max(values),
+    )
+
+    return {
+        "mean": float(mean),
+        "median": float(median),
+        "p90": float(p90),
+        "max": float(max_),
+    }
+
+
+def summarise(
+    nights: Sequence[dict[str, numpy.ndarray]],
+    distance_bins: Sequence[float] = (0, 5, 15, 30, 60, 90, 180),
+) -> dict[str, Any]:
+    """Summarises the events of one or more nights.
+
+    Parameters
+    ----------
+    nights
+        A list of the events for each night, as returned by `.get_night_events`.
+    distance_bins
+        The edges of the slew distance bins, in degrees.
+
+    Returns
+    -------
+    report
+        A dictionary with the slew, settle, tracking, and switch statistics.
+        Durations are in seconds and tracking offsets in arcsec.
+
+    """
+
+    def concat(key: str) -> numpy.ndarray:
+        if len(nights) == 0:
+            return numpy.empty(0)
+        return numpy.concatenate([night[key] for night in nights])
+
+    slew_duration = concat("slew_duration")
+    slew_distance = concat("slew_distance")
+
+    bins = numpy.asarray(distance_bins, dtype=float)
+    bin_index = numpy.digitize(slew_distance, bins) - 1
+
+    by_distance = []
+    for ii in range(len(bins) - 1):
+        durations = slew_duration[bin_index == ii]
+        by_distance.append(
+            {
+                "min_distance": float(bins[ii]),
+                "max_distance": float(bins[ii + 1]),
+                "count": len(durations),
+                "duration": _stats(durations),
+            }
+        )
+
+    tracking_n = concat("tracking_n")
+    tracking_duration = concat("tracking_duration")
+    n_tracking = int(tracking_n.sum())
+
+    # Drift rates in arcsec/minute for segments longer than a minute.
+    long_segments = tracking_duration > 60
+    minutes = tracking_duration[long_segments] / 60
+    drift_rate_ra = concat("tracking_drift_ra")[long_segments] / minutes
+    drift_rate_dec = concat("tracking_drift_dec")[long_segments] / minutes
+
+    rms_ra: float | None = None
+    rms_dec: float | None = None
+    if n_tracking > 0:
+        rms_ra = float(numpy.sqrt(concat("tracking_sumsq_ra").sum() / n_tracking))
+        rms_dec = float(numpy.sqrt(concat("tracking_sumsq_dec").sum() / n_tracking))
+
+    switches = (
+        numpy.sum([night["switches"] for night in nights], axis=0)
+        if len(nights) > 0
+        else numpy.zeros(len(SWITCH_BITS), dtype=int)
+    )
+
+    return {
+        "n_samples": int(concat("n_samples").sum()),
+        "slews": {
+            "count": len(slew_duration),
+            "duration": _stats(slew_duration),
+            "by_distance": by_distance,
+        },
+        "settle": {
+            "count": len(concat("settle_duration")),
+            "duration": _stats(concat("settle_duration")),
+        },
+        "tracking": {
+            "n_segments": len(tracking_n),
+            "time": float(tracking_duration.sum()),
+            "rms_ra": rms_ra,
+            "rms_dec": rms_dec,
+            "max_ra": _stats(concat("tracking_max_ra"))["max"],
+            "max_dec": _stats(concat("tracking_max_dec"))["max"],
+            "drift_rate_ra": _stats(numpy.abs(drift_rate_ra)),
+            "drift_rate_dec": _stats(numpy.abs(drift_rate_dec)),
+        },
+        "switches": {bit.name: int(count) for bit, count in zip(SWITCH_BITS, switches)},
+    }
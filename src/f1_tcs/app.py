@@ -12,10 +12,16 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 
-from f1_tcs import logger
+from f1_tcs import config, logger
+from f1_tcs.admission import AdmissionController
+from f1_tcs.guiding import GuideCorrector
+from f1_tcs.profiling import LoopLagMonitor, SamplingProfiler, ServerTimingMiddleware
 from f1_tcs.protocols import ASCII_Protocol, ASCOM_Protocol
+from f1_tcs.routers.admin import router as admin_router
+from f1_tcs.routers.analytics import router as analytics_router
 from f1_tcs.routers.ascii import router as ascii_router
 from f1_tcs.routers.ascom import router as status_router
+from f1_tcs.status import CachedSample, StatusPoller
 
 
 @asynccontextmanager
@@ -26,22 +32,64 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         ascii_instance = ASCII_Protocol.from_config()
         app.state.ascii_instance = ascii_instance
     except Exception as e:
-        logger.error(f"Failed to create ASCII_Protocol instance: {e}")
+        logger.error("Failed to create ASCII_Protocol instance: %s", e)
         app.state.ascii_instance = None
 
     try:
         ascom_instance = ASCOM_Protocol.from_config()
         app.state.ascom_instance = ascom_instance
     except Exception as e:
-        logger.error(f"Failed to create ASCOM_Protocol instance: {e}")
+        logger.error("Failed to create ASCOM_Protocol instance: %s", e)
         app.state.ascom_instance = None
 
-    yield  # Do nothing for now.
+    app.state.admission = {
+        "ascii": AdmissionController.from_config("ascii"),
+        "ascom": AdmissionController.from_config("ascom"),
+    }
+
+    profiling_config = config.get("profiling", {})
+
+    app.state.profiler = SamplingProfiler(
+        interval=profiling_config.get("sample_interval", 0.005)
+    )
+
+    app.state.loop_lag_monitor = LoopLagMonitor(
+        interval=profiling_config.get("loop_lag_interval", 0.1)
+    )
+    app.state.loop_lag_monitor.start()
+
+    app.state.pointing_cache = CachedSample(**config["ascom"].get("pointing_cache", {}))
+
+    app.state.status_poller = None
+    app.state.guide_corrector = None
+    if app.state.ascii_instance is not None:
+        app.state.status_poller = StatusPoller.from_config(app.state.ascii_instance)
+        app.state.status_poller.start()
+
+        corrector = GuideCorrector.from_config(app.state.ascii_instance)
+        app.state.guide_corrector = corrector
+        corrector.start()
+
+    yield
+
+    if app.state.status_poller is not None:
+        await app.state.status_poller.stop()
+
+    if app.state.guide_corrector is not None:
+        await app.state.guide_corrector.stop()
+
+    await app.state.loop_lag_monitor.stop()
 
 
 app = FastAPI(swagger_ui_parameters={"tagsSorter": "alpha"}, lifespan=lifespan)
+app.add_middleware(
+    ServerTimingMiddleware,
+    header=config.get("profiling", {}).get("server_timing", True),
+)
 app.include_router(status_router)
 app.include_router(ascii_router)
+app.include_router(admin_router)
+app.include_router(analytics_router)
 
 
 @app.get("/")
@@ -8,13 +8,28 @@
 
 from __future__ import annotations
 
-from fastapi import Request
+import math
 
+from typing import AsyncIterator, Callable
+
+from fastapi import HTTPException, Request
+from starlette.requests import HTTPConnection
+
+from f1_tcs.admission import AdmissionRejected, RouteClass
+from f1_tcs.guiding import GuideCorrector
 from f1_tcs.protocols.ascii import ASCII_Protocol
 from f1_tcs.protocols.ascom import ASCOM_Protocol
+from f1_tcs.status import StatusPoller
 
 
-__all__ = ["ascom", "ascii"]
+__all__ = [
+    "ascom",
+    "ascii",
+    "status_poller",
+    "guide_corrector",
+    "admission",
+    "rejected_exception",
+]
 
 
 def ascom() -> ASCOM_Protocol:
@@ -31,3 +46,70 @@ async def ascii(request: Request) -> ASCII_Protocol:
         app.state.ascii_instance = ASCII_Protocol.from_config()
 
     return app.state.ascii_instance
+
+
+async def status_poller(connection: HTTPConnection) -> StatusPoller:
+    """Dependency to get the ``StatusPoller`` instance."""
+
+    poller = getattr(connection.app.state, "status_poller", None)
+    if poller is None:
+        raise HTTPException(status_code=503, detail="Status poller is not running.")
+
+    return poller
+
+
+async def guide_corrector(connection: HTTPConnection) -> GuideCorrector:
+    """Dependency to get the ``GuideCorrector`` instance."""
+
+    corrector = getattr(connection.app.state, "guide_corrector", None)
+    if corrector is None:
+        raise HTTPException(status_code=503, detail="Guide corrector is not running.")
+
+    return corrector
+
+
+def rejected_exception(err: AdmissionRejected) -> HTTPException:
+    """Returns the 503 exception for a request that was not admitted."""
+
+    return HTTPException(
+        status_code=503,
+        detail=f"Request rejected: {err}",
+        headers={"Retry-After": str(max(1, math.ceil(err.retry_after)))},
+    )
+
+
+def admission(
+    backend: str,
+    route_class: RouteClass,
+) -> Callable[[Request], AsyncIterator[None]]:
+    """Returns a dependency that applies admission control to a route.
+
+    Parameters
+    ----------
+    backend
+        The backend the route talks to (``ascii`` or ``ascom``).
+    route_class
+        The route class: ``read``, ``motion``, or ``safety``. Rejected requests
+        get a 503 response with a ``Retry-After`` header.
+
+    """
+
+    async def dependency(request: Request) -> AsyncIterator[None]:
+        controllers = getattr(request.app.state, "admission", None) or {}
+        controller = controllers.get(backend)
+
+        if controller is None:
+            yield
+            return
+
+        try:
+            acquired = await controller.acquire(route_class)
+        except AdmissionRejected as err:
+            raise rejected_exception(err) from err
+
+        try:
+            yield
+        finally:
+            controller.release(route_class, acquired)
+
+    return dependency
@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: guiding.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import math
+import time
+
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
+
+from f1_tcs import config, logger
+from f1_tcs.protocols.ascii import ASCIIError
+
+
+if TYPE_CHECKING:
+    from f1_tcs.protocols.ascii import ASCII_Protocol
+
+
+__all__ = ["GuideCorrector", "GuideCorrectorError", "CorrectionResultDict"]
+
+
+MergeMode = Literal["sum", "latest"]
+
+
+class GuideCorrectorError(Exception):
+    """Exception raised when a correction cannot be accepted."""
+
+    pass
+
+
+class CorrectionResultDict(TypedDict):
+    """The result of dispatching a (possibly coalesced) correction."""
+
+    correction: str
+    ra: float
+    dec: float
+    n_coalesced: int
+    commands: list[str]
+    latencies: list[float]
+    error: str | None
+    superseded: bool
+
+
+class _PendingCorrection:
+    """Corrections of one type waiting to be dispatched."""
+
+    def __init__(self, generation: int = 0):
+        # The abort generation of the ASCII protocol when the correction was queued.
+        self.generation = generation
+
+        self.ra: float = 0.0
+        self.dec: float = 0.0
+        self.received: list[float] = []
+        self.futures: list[asyncio.Future[CorrectionResultDict]] = []
+
+
+class GuideCorrector:
+    """Coalesces high-rate guide/offset corrections before sending them.
+
+    Corrections are merged as soon as they are received, either by adding them
+    (``sum``) or by replacing the pending one (``latest``), depending on the
+    correction type. A single dispatcher sends the merged correction when the
+    previous one has completed, so the mount always acts on the freshest value
+    and slow commands do not cause a backlog. Corrections queued before an
+    ``Abort`` is sent to the controller fail instead of being sent after it.
+
+    Parameters
+    ----------
+    ascii
+        The ``ASCII_Protocol`` instance used to send the corrections.
+    corrections
+        A mapping of correction type to its definition. Each definition must
+        include a ``merge`` mode (``sum`` or ``latest``) and a ``command`` template
+        that is formatted with ``direction`` and ``value`` (in arcsec) for each axis
+        with a non-zero correction. An optional ``max_value`` (in arcsec) limits
+        the correction on each axis, both for each received correction and for
+        the merged one.
+    max_pending
+        Maximum number of corrections that can be waiting to be dispatched. When
+        the limit is reached, a ``latest`` correction supersedes the pending one
+        of the same type, and other corrections are rejected until the pending
+        ones have been sent.
+
+    """
+
+    def __init__(
+        self,
+        ascii: ASCII_Protocol,
+        corrections: dict[str, dict[str, Any]],
+        max_pending: int = 50,
+    ):
+        self.ascii = ascii
+        self.corrections = corrections
+        self.max_pending = max_pending
+
+        self._pending: dict[str, _PendingCorrection] = {}
+        self._new_correction = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.n_received: int = 0
+        self.n_dispatched: int = 0
+        self.n_coalesced: int = 0
+        self.n_superseded: int = 0
+        self.n_aborted: int = 0
+        self.n_rejected: int = 0
+        self.latencies: collections.deque[float] = collections.deque(maxlen=1000)
+
+    @classmethod
+    def from_config(cls, ascii: ASCII_Protocol) -> GuideCorrector:
+        """Creates a corrector using the ``guiding`` section of the configuration."""
+
+        guiding_config = config.get("guiding", {})
+
+        return cls(
+            ascii,
+            corrections=guiding_config.get("corrections", {}),
+            max_pending=guiding_config.get("max_pending", 50),
+        )
+
+    @property
+    def n_pending(self) -> int:
+        """The number of corrections waiting to be dispatched."""
+
+        return sum(len(pending.received) for pending in self._pending.values())
+
+    def start(self):
+        """Starts the dispatcher."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self):
+        """Stops the dispatcher and cancels any pending correction."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = None
+
+        for pending in self._pending.values():
+            for future in pending.futures:
+                future.cancel()
+
+        self._pending.clear()
+
+    def submit(
+        self,
+        correction: str,
+        ra: float = 0.0,
+        dec: float = 0.0,
+    ) -> asyncio.Future[CorrectionResultDict]:
+        """Queues a correction.
+
+        Parameters
+        ----------
+        correction
+            The correction type, as defined in the configuration.
+        ra,dec
+            The correction on each axis, in arcsec.
+
+        Returns
+        -------
+        future
+            A future that is resolved with a `.CorrectionResultDict` when the
+            correction, merged with any other pending ones, has been sent.
+
+        """
+
+        if correction not in self.corrections:
+            raise GuideCorrectorError(f"Unknown correction type {correction!r}.")
+
+        if not math.isfinite(ra) or not math.isfinite(dec):
+            self.n_rejected += 1
+            raise GuideCorrectorError("Corrections must be finite numbers.")
+
+        merge: MergeMode = self.corrections[correction].get("merge", "latest")
+        max_value: float | None = self.corrections[correction].get("max_value", None)
+
+        self._check_max_value(correction, ra, dec, max_value)
+
+        generation = self.ascii.abort_generation
+        if correction in self._pending:
+            if self._pending[correction].generation != generation:
+                self._abort(correction, self._pending.pop(correction))
+
+        if self.n_pending >= self.max_pending:
+            # The freshest correction is always kept. The pending ones it replaces
+            # are resolved now instead of waiting for the dispatch.
+            if merge == "latest" and correction in self._pending:
+                self._supersede(correction, self._pending.pop(correction))
+            else:
+                self.n_rejected += 1
+                raise GuideCorrectorError("Too many pending corrections.")
+
+        if merge == "sum" and correction in self._pending:
+            pending = self._pending[correction]
+            self._check_max_value(
+                correction, pending.ra + ra, pending.dec + dec, max_value
+            )
+
+        pending = self._pending.setdefault(correction, _PendingCorrection(generation))
+
+        if merge == "sum":
+            pending.ra += ra
+            pending.dec += dec
+        else:
+            pending.ra = ra
+            pending.dec = dec
+
+        future: asyncio.Future[CorrectionResultDict]
+        future = asyncio.get_running_loop().create_future()
+
+        pending.received.append(time.perf_counter())
+        pending.futures.append(future)
+
+        self.n_received += 1
+        self._new_correction.set()
+
+        return future
+
+    def get_stats(self) -> dict[str, Any]:
+        """Returns statistics about the corrections."""
+
+        latencies = list(self.latencies)
+
+        return {
+            "n_received": self.n_received,
+            "n_dispatched": self.n_dispatched,
+            "n_coalesced": self.n_coalesced,
+            "n_superseded": self.n_superseded,
+            "n_aborted": self.n_aborted,
+            "n_rejected": self.n_rejected,
+            "n_pending": self.n_pending,
+            "latency_mean": sum(latencies) / len(latencies) if latencies else None,
+            "latency_max": max(latencies) if latencies else None,
+        }
+
+    def _check_max_value(
+        self,
+        correction: str,
+        ra: float,
+        dec: float,
+        max_value: float | None,
+    ):
+        """Rejects a correction larger than the maximum value for its type."""
+
+        if max_value is None or max(abs(ra), abs(dec)) <= max_value:
+            return
+
+        self.n_rejected += 1
+        raise GuideCorrectorError(
+            f"The {correction} correction is larger than {max_value} arcsec."
+        )
+
+    def _get_commands(self, correction: str, ra: float, dec: float) -> list[str]:
+        """Returns the list of commands to apply a correction."""
+
+        template: str = self.corrections[correction]["command"]
+
+        commands: list[str] = []
+        for value, directions in ((ra, "EW"), (dec, "NS")):
+            if value == 0:
+                continue
+            direction = directions[0] if value > 0 else directions[1]
+            commands.append(template.format(direction=direction, value=abs(value)))
+
+        return commands
+
+    def _resolve(
+        self,
+        correction: str,
+        pending: _PendingCorrection,
+        commands: list[str],
+        error: str | None = None,
+        superseded: bool = False,
+    ):
+        """Resolves the futures of a pending correction."""
+
+        now = time.perf_counter()
+        latencies = [now - received for received in pending.received]
+
+        result = CorrectionResultDict(
+            correction=correction,
+            ra=pending.ra,
+            dec=pending.dec,
+            n_coalesced=len(pending.received),
+            commands=commands,
+            latencies=latencies,
+            error=error,
+            superseded=superseded,
+        )
+
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(result)
+
+    def _supersede(self, correction: str, pending: _PendingCorrection):
+        """Resolves pending corrections that were replaced by a newer one."""
+
+        self.n_superseded += len(pending.received)
+        self._resolve(correction, pending, [], superseded=True)
+
+    def _abort(self, correction: str, pending: _PendingCorrection):
+        """Fails pending corrections that were queued before an Abort."""
+
+        self.n_aborted += len(pending.received)
+        self._resolve(correction, pending, [], error="Cancelled by an Abort.")
+
+    async def _dispatch(self, correction: str, pending: _PendingCorrection):
+        """Sends a merged correction and resolves the futures."""
+
+        if pending.generation != self.ascii.abort_generation:
+            self._abort(correction, pending)
+            return
+
+        commands: list[str] = []
+        error: str | None = None
+
+        try:
+            commands = self._get_commands(correction, pending.ra, pending.dec)
+            for command in commands:
+                # Do not send the rest of the correction after an Abort.
+                if pending.generation != self.ascii.abort_generation:
+                    raise ASCIIError("Cancelled by an Abort.")
+                await self.ascii.send_command(command)
+        except Exception as err:
+            logger.error("Failed sending %s correction: %s", correction, err)
+            error = str(err)
+
+        self.n_dispatched += 1
+        self.n_coalesced += len(pending.received) - 1
+        self.latencies.extend(
+            time.perf_counter() - received for received in pending.received
+        )
+
+        self._resolve(correction, pending, commands, error=error)
+
+    async def _dispatch_loop(self):
+        """Waits for new corrections and dispatches them."""
+
+        while True:
+            await self._new_correction.wait()
+            self._new_correction.clear()
+
+            # Take all the corrections pending at this point. Any correction
+            # received while these are sent is merged for the next iteration.
+            pending = self._pending
+            self._pending = {}
+
+            for correction, merged in pending.items():
+                await self._dispatch(correction, merged)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: log.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+
+from typing import Any
+
+
+__all__ = [
+    "setup_logging",
+    "set_log_level",
+    "set_timing_log",
+    "JSONLinesFormatter",
+    "LOGGER_NAME",
+    "TIMING_LOGGER_NAME",
+]
+
+
+LOGGER_NAME = "f1_tcs"
+TIMING_LOGGER_NAME = "f1_tcs.timing"
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """Formats a record as a compact JSON object.
+
+    The fields in the ``data`` attribute of the record (passed with
+    ``extra={"data": {...}}``) are added to the object.
+
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {"time": record.created, "event": record.getMessage()}
+        payload.update(getattr(record, "data", {}))
+
+        return json.dumps(payload, separators=(",", ":"))
+
+
+class _ForwardHandler(logging.Handler):
+    """Passes records to the handlers of another logger.
+
+    Used to output the records through the handlers that uvicorn configures
+    for ``uvicorn.error``, but from the listener thread.
+
+    """
+
+    def __init__(self, target: str):
+        super().__init__()
+        self.target = target
+
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(self.target).handle(record)
+
+
+_listener: logging.handlers.QueueListener | None = None
+_timing_handler: logging.Handler | None = None
+
+
+def setup_logging(
+    level: str | int = logging.DEBUG,
+    timing: dict[str, Any] | None = None,
+) -> tuple[logging.Logger, logging.Logger]:
+    """Configures the package loggers.
+
+    Records are put in a queue and emitted by a background listener thread, so
+    slow terminal or disk I/O does not block the event loop. General records are
+    forwarded to the ``uvicorn.error`` handlers. Records from the timing logger
+    are written as JSON lines to their own handler, if enabled.
+
+    Parameters
+    ----------
+    level
+        The initial level of the package logger.
+    timing
+        The configuration for the timing log. Accepts ``enabled`` and ``path``.
+        If ``path`` is not set, the timing log is written to ``stderr``.
+
+    Returns
+    -------
+    loggers
+        A tuple with the package logger and the timing logger.
+
+    """
+
+    global _listener, _timing_handler
+
+    timing = timing or {}
+
+    logger = logging.getLogger(LOGGER_NAME)
+    timing_logger = logging.getLogger(TIMING_LOGGER_NAME)
+
+    if _listener is not None:
+        return logger, timing_logger
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    forward_handler = _ForwardHandler("uvicorn.error")
+    forward_handler.addFilter(lambda record: record.name != TIMING_LOGGER_NAME)
+
+    if timing.get("path"):
+        _timing_handler = logging.FileHandler(timing["path"])
+    else:
+        _timing_handler = logging.StreamHandler()
+    _timing_handler.setFormatter(JSONLinesFormatter())
+    _timing_handler.addFilter(logging.Filter(TIMING_LOGGER_NAME))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        forward_handler,
+        _timing_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+    set_log_level(level)
+    set_timing_log(timing.get("enabled", False))
+
+    return logger, timing_logger
+
+
+def set_log_level(level: str | int):
+    """Sets the level of the package logger."""
+
+    logging.getLogger(LOGGER_NAME).setLevel(level)
+
+
+def set_timing_log(enabled: bool):
+    """Enables or disables the timing log."""
+
+    level = logging.INFO if enabled else logging.CRITICAL + 1
+    logging.getLogger(TIMING_LOGGER_NAME).setLevel(level)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: profiling.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from fastapi.routing import APIRoute
+
+from f1_tcs.timing import RequestTimer, request_timer
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+__all__ = [
+    "SamplingProfiler",
+    "LoopLagMonitor",
+    "ServerTimingMiddleware",
+    "TimedRoute",
+]
+
+
+class SamplingProfiler:
+    """Samples the stack of the event loop thread from a background thread.
+
+    The samples are aggregated in the folded stack format (one line per unique
+    stack with frames separated by semicolons, followed by the number of samples)
+    that can be used directly with ``flamegraph.pl`` or speedscope.
+
+    Parameters
+    ----------
+    interval
+        The sampling interval, in seconds.
+
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+
+        self.counts: collections.Counter[str] = collections.Counter()
+        self.n_samples: int = 0
+
+        self.max_requests: int | None = None
+        self.n_requests: int = 0
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._done = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the profiler is sampling."""
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, max_requests: int | None = None):
+        """Starts sampling the thread that calls this method.
+
+        If ``max_requests`` is set, the profiler stops after that many requests
+        have completed (see `.request_finished`).
+
+        """
+
+        if self.running:
+            raise RuntimeError("The profiler is already running.")
+
+        self.counts.clear()
+        self.n_samples = 0
+
+        self.max_requests = max_requests
+        self.n_requests = 0
+
+        self._stop.clear()
+        self._done = asyncio.Event()
+
+        self._thread = threading.Thread(
+            target=self._sample,
+            args=(threading.get_ident(),),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        self._done.set()
+
+    async def wait(self):
+        """Waits until the profiler stops."""
+
+        await self._done.wait()
+
+    def request_finished(self):
+        """Counts a finished request and stops if ``max_requests`` is reached."""
+
+        if not self.running or self.max_requests is None:
+            return
+
+        self.n_requests += 1
+        if self.n_requests >= self.max_requests:
+            self.stop()
+
+    def folded(self) -> str:
+        """Returns the samples in the folded stack format."""
+
+        return "\n".join(f"{stack} {count}" for stack, count in self.counts.items())
+
+    def _sample(self, thread_id: int):
+        """Samples the stack of a thread until stopped."""
+
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                break
+
+            stack: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                filename = os.path.basename(code.co_filename)
+                stack.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            self.counts[";".join(reversed(stack))] += 1
+            self.n_samples += 1
+
+
+class LoopLagMonitor:
+    """Continuously measures how late the event loop wakes up from a sleep.
+
+    Parameters
+    ----------
+    interval
+        The time, in seconds, between measurements.
+    history
+        The number of measurements kept for the statistics.
+
+    """
+
+    def __init__(self, interval: float = 0.1, history: int = 600):
+        self.interval = interval
+        self.lags: collections.deque[float] = collections.deque(maxlen=history)
+
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """Starts the monitor."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        """Stops the monitor."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Returns statistics of the recent lag measurements, in seconds."""
+
+        lags = sorted(self.lags)
+        if len(lags) == 0:
+            return {"n": 0, "last": None, "mean": None, "p99": None, "max": None}
+
+        return {
+            "n": len(lags),
+            "last": self.lags[-1],
+            "mean": sum(lags) / len(lags),
+            "p99": lags[min(len(lags) - 1, int(0.99 * len(lags)))],
+            "max": lags[-1],
+        }
+
+    async def _monitor(self):
+        """Measures the loop lag every ``interval`` seconds."""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            t0 = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - t0 - self.interval))
+
+
+class ServerTimingMiddleware:
+    """Adds a ``Server-Timing`` header with the timing breakdown of each request.
+
+    For routes that use `.TimedRoute`, ``deps`` is the time from the start of the
+    request until the endpoint is called (routing, body parsing, and dependency
+    resolution, including any admission wait), ``app`` the time in the endpoint,
+    and ``serialize`` the time from when the endpoint returns until the response
+    starts. Also notifies the profiler in ``app.state.profiler``, if any, when a
+    request finishes.
+
+    Parameters
+    ----------
+    app
+        The ASGI application.
+    header
+        Whether to add the header. If ``False``, the timings are still collected
+        and the profiler notified.
+
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True):
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = RequestTimer()
+        token = request_timer.set(timer)
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                self.add_route_timings(timer)
+
+            if self.header and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timer.server_timing().encode()))
+                message["headers"] = headers
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_timer.reset(token)
+
+            profiler = getattr(scope["app"].state, "profiler", None)
+            if profiler is not None:
+                profiler.request_finished()
+
+    @staticmethod
+    def add_route_timings(timer: RequestTimer):
+        """Derives the dependency and serialisation times from the route marks."""
+
+        endpoint_start = timer.marks.get("endpoint_start")
+        endpoint_end = timer.marks.get("endpoint_end")
+        if endpoint_start is None or endpoint_end is None:
+            return
+
+        timer.add("deps", endpoint_start - timer.start)
+        timer.add("serialize", time.perf_counter() - endpoint_end)
+
+
+class TimedRoute(APIRoute):
+    """An ``APIRoute`` that records when its endpoint starts and finishes.
+
+    The endpoint is wrapped before the route is set up, so the timing also
+    applies to the copies of the route that FastAPI creates when the router is
+    included in the app. `.ServerTimingMiddleware` uses the marks to derive the
+    dependency and serialisation times. Only coroutine endpoints are timed.
+
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._timed_endpoint(endpoint)
+
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _timed_endpoint(endpoint: Callable) -> Callable:
+        # functools.wraps keeps the signature and the module globals of the
+        # original endpoint, which FastAPI uses to resolve the annotations.
+        @functools.wraps(endpoint)
+        async def timed_endpoint(*args, **kwargs):
+            timer = request_timer.get()
+            if timer is None:
+                return await endpoint(*args, **kwargs)
+
+            timer.marks["endpoint_start"] = time.perf_counter()
+            timer.begin("app")
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timer.end("app")
+                timer.marks["endpoint_end"] = time.perf_counter()
+
+        return timed_endpoint
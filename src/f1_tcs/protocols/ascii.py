@@ -9,9 +9,37 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
 
-from f1_tcs import config, logger
+from typing import Any, AsyncIterator, TypedDict
+
+from f1_tcs import config, logger, timing_logger
+from f1_tcs.timing import measure
+from f1_tcs.tools import ScopeStatusMaskbit, parse_scope_status
+
+
+__all__ = [
+    "ASCII_Protocol",
+    "ASCIIError",
+    "check_sequence",
+    "PriorityLock",
+    "SequenceStep",
+    "SequenceResultDict",
+    "SequenceStepResultDict",
+]
+
+
+#: Commands that do not change the state of the mount and can be sent while a
+#: sequence is waiting.
+READ_ONLY_COMMANDS: tuple[str, ...] = ("ReadScopeStatus", "ReadScopeDestination")
+
+#: A sequence step. Either a command string, ``{"wait": <seconds>}``, or
+#: ``{"until": {"set" | "clear": <mask bit>, "timeout": <s>, "interval": <s>}}``.
+SequenceStep = str | dict[str, Any]
 
 
 class ASCIIError(Exception):
@@ -20,16 +48,149 @@ class ASCIIError(Exception):
     pass
 
 
+class SequenceStepResultDict(TypedDict):
+    """The result of a sequence step."""
+
+    step: str
+    response: str | None
+    elapsed: float  # For pipelined commands, since the batch was sent.
+
+
+class SequenceResultDict(TypedDict):
+    """The result of running a sequence."""
+
+    name: str
+    steps: list[SequenceStepResultDict]
+    elapsed: float
+
+
+class PriorityLock:
+    """An asyncio lock in which priority waiters go ahead of the regular ones.
+
+    Waiters of the same kind acquire the lock in FIFO order.
+
+    """
+
+    def __init__(self):
+        self._locked: bool = False
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._priority_waiters: collections.deque[asyncio.Future] = collections.deque()
+
+    def locked(self) -> bool:
+        """Whether the lock is held."""
+
+        return self._locked
+
+    async def acquire(self, priority: bool = False):
+        """Acquires the lock."""
+
+        if not self._locked:
+            self._locked = True
+            return
+
+        waiters = self._priority_waiters if priority else self._waiters
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The lock may have been handed over just before the cancellation.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+
+    def release(self):
+        """Releases the lock, handing it over to the next waiter, if any."""
+
+        for waiters in (self._priority_waiters, self._waiters):
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(True)
+                    return
+
+        self._locked = False
+
+    @asynccontextmanager
+    async def hold(self, priority: bool = False) -> AsyncIterator[None]:
+        """Holds the lock for the duration of the context."""
+
+        await self.acquire(priority=priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def check_sequence(steps: list[SequenceStep]) -> list[SequenceStep]:
+    """Validates the steps of a sequence. Raises `.ASCIIError` if invalid."""
+
+    for step in steps:
+        if isinstance(step, str):
+            continue
+
+        try:
+            if not isinstance(step, dict) or len(step) != 1:
+                raise ValueError("must be a command, wait, or until")
+
+            if "wait" in step:
+                float(step["wait"])
+                continue
+
+            condition = step["until"]
+            keys = {"set", "clear"} & set(condition)
+            if len(keys) != 1:
+                raise ValueError("the condition must have either set or clear")
+            if condition[keys.pop()] not in ScopeStatusMaskbit.__members__:
+                raise ValueError("unknown mask bit")
+            float(condition.get("timeout", 60))
+            float(condition.get("interval", 1))
+
+        except (KeyError, TypeError, ValueError) as err:
+            raise ASCIIError(f"Invalid sequence step {step!r}: {err}") from err
+
+    return steps
+
+
 class ASCII_Protocol:
     """A class to connect to the F1 ASCII server."""
 
-    def __init__(self, host: str, port: int):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sequences: dict[str, list[SequenceStep]] | None = None,
+    ):
         self.host = host
         self.port = port
 
+        self.sequences = sequences or {}
+
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
 
+        # Serialises access to the socket so that concurrent callers (e.g. the
+        # status poller and the API routes) do not interleave their replies.
+        # Abort goes ahead of any other command waiting for the socket.
+        self._lock = PriorityLock()
+
+        # Held while a sequence runs. Commands that change the state of the mount
+        # (other than Abort) wait for the sequence to finish.
+        self._sequence_lock = asyncio.Lock()
+        self._sequence_task: asyncio.Task | None = None
+
+        # Increased on each Abort. Commands and sequences that change the state of
+        # the mount are discarded if an Abort was sent while they were waiting.
+        self.abort_generation: int = 0
+
+        for steps in self.sequences.values():
+            check_sequence(steps)
+
     @classmethod
     def from_config(cls) -> ASCII_Protocol:
         """Create an ``ASCII_Protocol`` instance from the configuration file."""
@@ -42,13 +203,13 @@ class ASCII_Protocol:
             host = config["f1_ascii"]["host"]
             port = config["f1_ascii"]["port"]
 
-        return cls(host=host, port=port)
+        return cls(host=host, port=port, sequences=config.get("sequences", {}))
 
     async def connect(self):
         """Connect to the F1 ASCII server."""
 
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-        logger.debug(f"Connected to ASCII server at {self.host}:{self.port}")
+        logger.debug("Connected to ASCII server at %s:%s", self.host, self.port)
 
     async def disconnect(self):
         """Disconnect from the F1 ASCII server."""
@@ -56,7 +217,11 @@ class ASCII_Protocol:
         if self.writer:
             self.writer.close()
             await self.writer.wait_closed()
-            logger.debug(f"Disconnected from ASCII server at {self.host}:{self.port}")
+            logger.debug(
+                "Disconnected from ASCII server at %s:%s",
+                self.host,
+                self.port,
+            )
 
             self.writer = None
             self.reader = None
@@ -72,40 +237,288 @@ class ASCII_Protocol:
     async def send_command(self, command: str) -> str:
         """Send a command to the F1 ASCII server and return the response.
 
+        If a sequence is running, commands that change the state of the mount wait
+        until it finishes. ``Abort`` is sent immediately and aborts the sequence,
+        and any command or sequence that was waiting to be sent fails with an
+        `.ASCIIError` instead of moving the mount after the abort.
+
         TODO: parse the response and confirm if the command was successful. This
         is a bit hard to do at a general level because the command reponses are not
         standardized.
 
         """
 
+        command_name = command.strip().split(" ")[0]
+
+        with measure("upstream"):
+            if command_name == "Abort":
+                return await self._send_abort(command)
+            elif command_name not in READ_ONLY_COMMANDS:
+                generation = self.abort_generation
+                async with self._sequence_lock:
+                    async with self._lock.hold():
+                        self._check_aborted(generation, command_name)
+                        return await self._send_command(command)
+
+            async with self._lock.hold():
+                return await self._send_command(command)
+
+    async def _send_abort(self, command: str) -> str:
+        """Sends an Abort ahead of any other command waiting for the socket."""
+
+        # Invalidate everything that is waiting to be sent and stop the sequence
+        # before it can send anything else.
+        self.abort_generation += 1
+        if self._sequence_task is not None:
+            self._sequence_task.cancel()
+
+        async with self._lock.hold(priority=True):
+            response = await self._send_command(command)
+
+        await self.abort_sequence()
+
+        return response
+
+    def _check_aborted(self, generation: int, name: str):
+        """Raises if an Abort was sent since ``generation`` was recorded."""
+
+        if self.abort_generation != generation:
+            raise ASCIIError(f"{name} was cancelled by an Abort.")
+
+    async def _send_command(self, command: str) -> str:
+        """Sends a command. Must be called with the lock acquired."""
+
+        response, _ = (await self._send_commands([command]))[0]
+        return response
+
+    async def _send_commands(self, commands: list[str]) -> list[tuple[str, float]]:
+        """Sends a list of commands without waiting for the replies in between.
+
+        All the commands are written to the socket before reading the replies, which
+        the server sends in order. Returns a list of tuples with the reply to each
+        command and the time, in seconds, from when the commands were sent until
+        the reply was received. Must be called with the lock acquired.
+
+        """
+
         # The F1 ASCII server doesn't like if you connect and disconnect continuously,
         # so we keep the socket open and only reconnect if the connection is lost.
         if not self.is_connected():
             try:
                 await asyncio.wait_for(self.disconnect(), timeout=5)
             except Exception as e:
-                logger.error(f"Error disconnecting from ASCII server: {e}")
+                logger.error("Error disconnecting from ASCII server: %s", e)
 
             await self.connect()
 
         assert self.writer is not None and self.reader is not None
 
-        # Send the command.
-        if not command.endswith("\n"):
-            command += "\n"
+        # Send the commands.
+        commands = [cmd if cmd.endswith("\n") else cmd + "\n" for cmd in commands]
+
+        command = commands[0]
+        replies: list[tuple[str, float]] = []
 
         try:
-            self.writer.write(command.encode())
+            t0 = time.perf_counter()
+
+            self.writer.write("".join(commands).encode())
             await self.writer.drain()
 
-            # Wait for a response.
-            response = await asyncio.wait_for(self.reader.readline(), timeout=1.0)
-            return response.decode().strip()
+            # Wait for the responses. asyncio.timeout, unlike wait_for, does not
+            # swallow a cancellation that arrives at the same time as a reply.
+            for command in commands:
+                async with asyncio.timeout(1.0):
+                    response = await self.reader.readline()
+                replies.append((response.decode().strip(), time.perf_counter() - t0))
+
+            if timing_logger.isEnabledFor(logging.INFO):
+                for command, (_, elapsed) in zip(commands, replies):
+                    timing_logger.info(
+                        "ascii_command",
+                        extra={
+                            "data": {
+                                "command": command.strip(),
+                                "elapsed": round(elapsed, 6),
+                                "pipelined": len(commands),
+                            }
+                        },
+                    )
+
+            return replies
 
         except asyncio.TimeoutError:
-            logger.error(f"Timeout while waiting for response to command: {command}")
+            logger.error("Timeout while waiting for response to command: %r", command)
+
+            # A late reply would be read as the response to the next command, so
+            # drop the connection and let the next command reconnect.
+            self.writer.close()
+
             raise ASCIIError(f"Timed out waiting for response to command: {command}")
 
+        except asyncio.CancelledError:
+            # Same as above, the pending replies would be read by the next command.
+            if len(replies) < len(commands):
+                self.writer.close()
+            raise
+
         except Exception as e:
-            logger.error(f"Error sending command '{command}': {e}")
+            logger.error("Error sending command %r: %s", command, e)
             raise ASCIIError(f"Error sending command '{command}': {e}")
+
+    async def run_sequence(
+        self,
+        sequence: str | list[SequenceStep],
+    ) -> SequenceResultDict:
+        """Runs a sequence of commands as a single unit.
+
+        While the sequence runs no other command that changes the state of the
+        mount is sent, with the exception of ``Abort``, which cancels the sequence.
+        Consecutive commands are pipelined. Read-only commands, such as the status
+        polling, can be sent while the sequence is waiting.
+
+        Parameters
+        ----------
+        sequence
+            The name of a sequence defined in the ``sequences`` section of the
+            configuration, or a list of steps. A step can be a command string,
+            ``{"wait": <seconds>}``, or ``{"until": <condition>}``, where the
+            condition is a dictionary with a mask bit name to wait to be ``set``
+            or ``clear``, and optionally a ``timeout`` and a polling ``interval``
+            in seconds.
+
+        Returns
+        -------
+        result
+            A dictionary with the steps, their replies, and their timings.
+
+        """
+
+        if isinstance(sequence, str):
+            if sequence not in self.sequences:
+                raise ASCIIError(f"Unknown sequence {sequence!r}.")
+            name, steps = sequence, self.sequences[sequence]
+        else:
+            name, steps = "custom", check_sequence(sequence)
+
+        generation = self.abort_generation
+
+        async with self._sequence_lock:
+            self._check_aborted(generation, f"Sequence {name!r}")
+
+            t0 = time.perf_counter()
+            self._sequence_task = asyncio.create_task(self._run_steps(steps))
+            try:
+                results = await self._sequence_task
+            except asyncio.CancelledError:
+                # If the caller was cancelled, propagate the cancellation. Otherwise
+                # the sequence was cancelled by abort_sequence().
+                current_task = asyncio.current_task()
+                if current_task is not None and current_task.cancelling() > 0:
+                    raise
+                raise ASCIIError(f"Sequence {name!r} was aborted.")
+            finally:
+                self._sequence_task = None
+
+        return SequenceResultDict(
+            name=name,
+            steps=results,
+            elapsed=time.perf_counter() - t0,
+        )
+
+    async def abort_sequence(self) -> bool:
+        """Aborts the running sequence, if any. Returns ``True`` if aborted."""
+
+        task = self._sequence_task
+        if task is None or task.done():
+            return False
+
+        task.cancel()
+        await asyncio.wait([task], timeout=5)
+
+        return True
+
+    async def _run_steps(
+        self,
+        steps: list[SequenceStep],
+    ) -> list[SequenceStepResultDict]:
+        """Runs the steps of a sequence, pipelining consecutive commands."""
+
+        results: list[SequenceStepResultDict] = []
+        commands: list[str] = []
+
+        async def flush():
+            if len(commands) == 0:
+                return
+
+            with measure("upstream"):
+                async with self._lock.hold():
+                    replies = await self._send_commands(commands)
+
+            for command, (response, elapsed) in zip(commands, replies):
+                results.append(
+                    SequenceStepResultDict(
+                        step=command,
+                        response=response,
+                        elapsed=elapsed,
+                    )
+                )
+
+            commands.clear()
+
+        for step in steps:
+            if isinstance(step, str):
+                commands.append(step)
+                continue
+
+            await flush()
+
+            t0 = time.perf_counter()
+            if "wait" in step:
+                await asyncio.sleep(float(step["wait"]))
+                description = f"wait {step['wait']}"
+            elif "until" in step:
+                description = await self._wait_until(step["until"])
+            else:
+                raise ASCIIError(f"Invalid sequence step {step!r}.")
+
+            results.append(
+                SequenceStepResultDict(
+                    step=description,
+                    response=None,
+                    elapsed=time.perf_counter() - t0,
+                )
+            )
+
+        await flush()
+
+        return results
+
+    async def _wait_until(self, condition: dict[str, Any]) -> str:
+        """Waits until a status mask bit is set or cleared."""
+
+        if "set" in condition:
+            bit, expected = ScopeStatusMaskbit[condition["set"]], True
+        else:
+            bit, expected = ScopeStatusMaskbit[condition["clear"]], False
+
+        description = f"until {bit.name} {'set' if expected else 'clear'}"
+
+        timeout = float(condition.get("timeout", 60))
+        interval = float(condition.get("interval", 1))
+
+        t0 = time.perf_counter()
+        while True:
+            with measure("upstream"):
+                async with self._lock.hold():
+                    reply = await self._send_command("ReadScopeStatus")
+
+            status = parse_scope_status(reply)
+
+            if bool(status["bool_params"] & bit) == expected:
+                return description
+
+            if time.perf_counter() - t0 > timeout:
+                raise ASCIIError(f"Timed out waiting {description}.")
+
+            await asyncio.sleep(interval)
@@ -7,14 +7,17 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import re
+import time
 
 from typing import Literal
 
 import httpx
 
-from f1_tcs import config
+from f1_tcs import config, timing_logger
+from f1_tcs.timing import measure
 
 
 __all__ = ["ASCOM_Protocol", "ASCOMError"]
@@ -118,16 +121,31 @@ class ASCOM_Protocol:
         path = re.sub(r"/{2,}", "/", path)
 
         # Query the ASCOM server.
-        async with httpx.AsyncClient(base_url=base_url) as client:
-            response = await client.request(
-                method,
-                path,
-                params=params,
-                timeout=config["ascom"]["timeout"],
+        t0 = time.perf_counter()
+        with measure("upstream"):
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                response = await client.request(
+                    method,
+                    path,
+                    params=params,
+                    timeout=config["ascom"]["timeout"],
+                )
+                response.raise_for_status()
+
+        if timing_logger.isEnabledFor(logging.INFO):
+            timing_logger.info(
+                "ascom_call",
+                extra={
+                    "data": {
+                        "method": method,
+                        "path": path,
+                        "elapsed": round(time.perf_counter() - t0, 6),
+                    }
+                },
             )
-            response.raise_for_status()
 
-        data = response.json()
+        with measure("parse"):
+            data = response.json()
         if "ErrorNumber" in data:
             if raise_on_error and data["ErrorNumber"] != 0:
                 raise ASCOMError(
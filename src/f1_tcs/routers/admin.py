@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: admin.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from f1_tcs import logger, timing_logger
+from f1_tcs.log import set_log_level, set_timing_log
+from f1_tcs.profiling import SamplingProfiler
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+@router.get("/log_level", summary="Get the log level")
+async def get_log_level():
+    """Returns the current log level and whether the timing log is enabled."""
+
+    return {
+        "level": logging.getLevelName(logger.getEffectiveLevel()),
+        "timing": timing_logger.isEnabledFor(logging.INFO),
+    }
+
+
+@router.put("/log_level", summary="Set the log level")
+async def put_log_level(level: Annotated[LogLevel, Query(description="Log level.")]):
+    """Changes the log level of the protocol and server loggers."""
+
+    set_log_level(level)
+
+    return await get_log_level()
+
+
+@router.put("/timing_log", summary="Enable or disable the timing log")
+async def put_timing_log(
+    enabled: Annotated[bool, Query(description="Enable the timing log.")],
+):
+    """Enables or disables the JSON lines log of per-command timings."""
+
+    set_timing_log(enabled)
+
+    return await get_log_level()
+
+
+@router.get("/admission", summary="Admission control statistics")
+async def admission(request: Request):
+    """Returns the state of the admission control for each backend."""
+
+    controllers = getattr(request.app.state, "admission", None) or {}
+
+    return {backend: ctrl.get_stats() for backend, ctrl in controllers.items()}
+
+
+@router.get("/loop_lag", summary="Event loop lag statistics")
+async def loop_lag(request: Request):
+    """Returns statistics of the recent event loop lag, in seconds."""
+
+    monitor = getattr(request.app.state, "loop_lag_monitor", None)
+    if monitor is None:
+        raise HTTPException(status_code=503, detail="Loop lag monitor is not running.")
+
+    return monitor.get_stats()
+
+
+@router.put("/profile", summary="Profile the server")
+async def start_profile(
+    request: Request,
+    seconds: Annotated[
+        float | None,
+        Query(gt=0, le=300, description="Profile for this many seconds."),
+    ] = None,
+    requests: Annotated[
+        int | None,
+        Query(gt=0, le=10000, description="Profile the next N requests."),
+    ] = None,
+):
+    """Samples the event loop thread and returns a flame graph profile.
+
+    With ``seconds``, the request waits and returns the profile in the folded
+    stack format. With ``requests``, the profiler stops after the next N
+    requests and the profile can be retrieved with ``GET /admin/profile``.
+
+    """
+
+    if (seconds is None) == (requests is None):
+        raise HTTPException(
+            status_code=400,
+            detail="Exactly one of seconds or requests must be provided.",
+        )
+
+    profiler: SamplingProfiler = request.app.state.profiler
+    if profiler.running:
+        raise HTTPException(status_code=409, detail="The profiler is already running.")
+
+    if seconds is not None:
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        return PlainTextResponse(profiler.folded())
+
+    # The request that starts the profiler counts as finished when it returns.
+    assert requests is not None
+    profiler.start(max_requests=requests + 1)
+
+    return {"running": True, "max_requests": requests}
+
+
+@router.get("/profile", summary="Get the latest profile")
+async def get_profile(request: Request):
+    """Returns the latest profile in the folded stack format."""
+
+    profiler: SamplingProfiler = request.app.state.profiler
+    if profiler.running:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Profiler running ({profiler.n_requests} requests so far).",
+        )
+
+    return PlainTextResponse(profiler.folded())
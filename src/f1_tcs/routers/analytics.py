@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: analytics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import pathlib
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from f1_tcs import config
+from f1_tcs.analytics import get_night_events, summarise
+from f1_tcs.profiling import TimedRoute
+from f1_tcs.telemetry import list_nights
+
+
+router = APIRouter(prefix="/analytics", tags=["analytics"], route_class=TimedRoute)
+
+
+def get_telemetry_path() -> pathlib.Path:
+    """Returns the directory with the telemetry files."""
+
+    return pathlib.Path(config["telemetry"]["path"]).expanduser()
+
+
+def get_report(nights: list[str]) -> dict[str, Any]:
+    """Computes the report for a list of nights."""
+
+    path = get_telemetry_path()
+    events = [get_night_events(path / f"{night}.csv") for night in nights]
+
+    distance_bins = config.get("analytics", {}).get("slew_distance_bins")
+    if distance_bins:
+        report = summarise(events, distance_bins=distance_bins)
+    else:
+        report = summarise(events)
+
+    return {"nights": nights, **report}
+
+
+@router.get("/nights", summary="List the nights with telemetry")
+async def nights():
+    """Returns the nights for which telemetry has been recorded."""
+
+    return list_nights(get_telemetry_path())
+
+
+@router.get("/night/{night}", summary="Performance report for a night")
+async def night_report(
+    night: Annotated[datetime.date, Path(description="The night, as YYYY-MM-DD.")],
+):
+    """Returns the slew, settle, tracking drift, and switch statistics for a night.
+
+    The night is the local date at the start of the night. Results are cached and
+    only recomputed if the telemetry for the night changes.
+
+    """
+
+    if night.isoformat() not in list_nights(get_telemetry_path()):
+        raise HTTPException(status_code=404, detail=f"No telemetry for {night}.")
+
+    return await asyncio.to_thread(get_report, [night.isoformat()])
+
+
+@router.get("/range", summary="Performance report for a range of nights")
+async def night_range(
+    start: Annotated[datetime.date, Query(description="First night.")],
+    end: Annotated[datetime.date, Query(description="Last night (inclusive).")],
+):
+    """Returns the statistics for all the nights with telemetry in a date range."""
+
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start.")
+
+    nights = [
+        night
+        for night in list_nights(get_telemetry_path())
+        if start.isoformat() <= night <= end.isoformat()
+    ]
+
+    return await asyncio.to_thread(get_report, nights)
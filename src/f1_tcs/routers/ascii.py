@@ -9,22 +9,48 @@
 from __future__ import annotations
 
 import asyncio
-
-from typing import TYPE_CHECKING, Annotated
-
-from fastapi import APIRouter, Depends, HTTPException
+from contextlib import nullcontext
+
+from typing import TYPE_CHECKING, Annotated, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from pydantic import BaseModel, Field
 
-from f1_tcs.dependencies import ascii
+from f1_tcs import config
+from f1_tcs.admission import AdmissionRejected
+from f1_tcs.dependencies import (
+    admission,
+    ascii,
+    guide_corrector,
+    rejected_exception,
+    status_poller,
+)
+from f1_tcs.guiding import GuideCorrectorError
+from f1_tcs.profiling import TimedRoute
 from f1_tcs.protocols.ascii import ASCIIError
-from f1_tcs.tools import parse_scope_status
+from f1_tcs.timing import measure
+from f1_tcs.tools import etag_matches, parse_scope_status
 
 
 if TYPE_CHECKING:
+    from f1_tcs.admission import AdmissionController
+    from f1_tcs.guiding import GuideCorrector
     from f1_tcs.protocols.ascii import ASCII_Protocol
+    from f1_tcs.status import StatusPoller
+    from f1_tcs.tools import ScopeStatusDict
 
 
-router = APIRouter(prefix="/ascii", tags=["ascii"])
+router = APIRouter(prefix="/ascii", tags=["ascii"], route_class=TimedRoute)
 
 
 class StatusResponse(BaseModel):
@@ -78,48 +104,243 @@ class StatusResponse(BaseModel):
         float,
         Field(description="Airmass."),
     ]
+    sequence: Annotated[
+        int | None,
+        Field(description="Sequence number of the status sample."),
+    ] = None
+
+
+class SequenceStepResponse(BaseModel):
+    """Response model for a step in a sequence."""
+
+    step: Annotated[str, Field(description="The command or wait step.")]
+    response: Annotated[
+        str | None,
+        Field(description="The reply to the command, if any."),
+    ]
+    elapsed: Annotated[float, Field(description="Duration of the step in seconds.")]
+
+
+class SequenceResponse(BaseModel):
+    """Response model for the sequence endpoint."""
+
+    name: Annotated[str, Field(description="The name of the sequence.")]
+    steps: Annotated[
+        list[SequenceStepResponse],
+        Field(description="The steps in the sequence and their timings."),
+    ]
+    elapsed: Annotated[float, Field(description="Total duration in seconds.")]
+
+
+async def read_status(
+    request: Request,
+    ascii: ASCII_Protocol,
+    poller: StatusPoller | None,
+) -> ScopeStatusDict:
+    """Reads the status from the controller, subject to admission control.
+
+    If the request is not admitted, the latest sample from the poller is returned
+    instead, if available.
+
+    """
+
+    controllers = getattr(request.app.state, "admission", None) or {}
+    controller: AdmissionController | None = controllers.get("ascii")
+
+    try:
+        async with controller.admit("read") if controller else nullcontext():
+            status = await ascii.send_command("ReadScopeStatus")
+    except AdmissionRejected as err:
+        if poller is not None and poller.latest is not None:
+            return poller.latest
+        raise rejected_exception(err) from err
+    except ASCIIError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    with measure("parse"):
+        parsed_status = parse_scope_status(status)
+
+    if poller is not None:
+        poller.process(parsed_status)
+
+    return parsed_status
 
 
 @router.get(
     "/status",
     response_model=StatusResponse,
     summary="Get the status of the telescope",
+    responses={304: {"description": "The status has not changed."}},
 )
-async def status(ascii: ASCII_Protocol = Depends(ascii)):
-    """Get the status of the telescope."""
+async def status(
+    request: Request,
+    response: Response,
+    ascii: ASCII_Protocol = Depends(ascii),
+    after: Annotated[
+        int | None,
+        Query(description="Wait until the sequence number is larger than this."),
+    ] = None,
+    timeout: Annotated[
+        float,
+        Query(ge=0, le=60, description="Maximum time to wait when using after."),
+    ] = 30,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """Get the status of the telescope.
+
+    The status is served from the poller if its latest sample is recent enough.
+    Each sample has a sequence number that increases when the status changes
+    beyond the deadbands, and a matching ETag. Requests with a matching
+    ``If-None-Match`` header receive a 304 response. With ``after``, the request
+    waits until a sample with a larger sequence number is available or the
+    timeout is reached.
+
+    """
+
+    poller: StatusPoller | None = getattr(request.app.state, "status_poller", None)
+
+    if after is not None and poller is not None:
+        await poller.version.wait(after, timeout)
+
+    sample: ScopeStatusDict | None = None
+    if poller is not None:
+        sample = poller.get_latest(config["status"]["max_age"])
+
+    if sample is None:
+        sample = await read_status(request, ascii, poller)
+
+    if poller is None:
+        return StatusResponse(**sample, sequence=None)
+
+    etag = poller.version.etag
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+
+    return StatusResponse(**sample, sequence=poller.version.sequence)
+
+
+@router.websocket("/status/stream")
+async def status_stream(
+    websocket: WebSocket,
+    mode: Literal["all", "events", "deltas"] = "all",
+    poller: StatusPoller = Depends(status_poller),
+):
+    """Streams changes in the telescope status.
+
+    On connection a ``snapshot`` message with the latest status is sent. After
+    that the stream contains ``event`` messages when a mask bit is set or cleared
+    and ``delta`` messages with the numeric fields that changed beyond their
+    deadbands. Use ``mode`` to receive only events or only deltas. If the client
+    does not keep up, the messages waiting to be sent are replaced by a new
+    ``snapshot`` that includes the number of ``dropped`` messages.
+
+    """
+
+    await websocket.accept()
+
+    subscription = poller.subscribe(mode)
+
+    async def send_messages():
+        while True:
+            await websocket.send_json(await subscription.get())
+
+    sender = asyncio.create_task(send_messages())
 
     try:
-        status = await ascii.send_command("ReadScopeStatus")
-        parsed_status = parse_scope_status(status)
-        return StatusResponse(**parsed_status)
+        # Incoming messages are ignored, but reading them is the only way to
+        # notice that the client has disconnected when there is nothing to send.
+        while True:
+            await websocket.receive_text()
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        sender.cancel()
+        poller.unsubscribe(subscription)
 
-    except ASCIIError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+@router.websocket("/guide")
+async def guide(
+    websocket: WebSocket,
+    corrector: GuideCorrector = Depends(guide_corrector),
+):
+    """Receives a stream of guide/offset corrections.
+
+    Each message must be a JSON object with the ``correction`` type and the
+    ``ra`` and ``dec`` corrections in arcsec. Corrections received while the
+    previous one is being sent are coalesced. For each correction an ``ack``
+    message is sent back with the number of coalesced corrections and the
+    end-to-end latency of each one, or with ``superseded`` set if it was replaced
+    by a newer correction before being sent. Corrections that are not finite or
+    are over the maximum value for their type are rejected with an ``error``
+    message.
+
+    """
+
+    await websocket.accept()
+
+    replies: asyncio.Queue[dict] = asyncio.Queue()
+
+    def on_done(future: asyncio.Future):
+        if not future.cancelled():
+            replies.put_nowait({"type": "ack", **future.result()})
+
+    async def send_replies():
+        while True:
+            await websocket.send_json(await replies.get())
+
+    sender = asyncio.create_task(send_replies())
+
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+                future = corrector.submit(
+                    message["correction"],
+                    ra=float(message.get("ra", 0.0)),
+                    dec=float(message.get("dec", 0.0)),
+                )
+            except (GuideCorrectorError, KeyError, TypeError, ValueError) as err:
+                replies.put_nowait({"type": "error", "error": str(err)})
+            else:
+                future.add_done_callback(on_done)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        sender.cancel()
+
+
+@router.get("/guide/stats", summary="Guide correction statistics")
+async def guide_stats(corrector: GuideCorrector = Depends(guide_corrector)):
+    """Returns statistics about the received and coalesced corrections."""
+
+    return corrector.get_stats()
 
 
 @router.get(
     "/sync_to_zenith",
     response_model=bool,
     summary="Sync the telescope to zenith",
+    dependencies=[Depends(admission("ascii", "motion"))],
 )
 async def sync_to_zenith(ascii: ASCII_Protocol = Depends(ascii)):
     """Sets the Zenith as the current pointing position of the telescope."""
 
     try:
-        await ascii.send_command("UnPark")
-        await ascii.send_command("SyncToAltAz 0 89.9")
-        await ascii.send_command("MotorsToAuto")
-
-        await asyncio.sleep(3)
-
-        await ascii.send_command("Park")
+        await ascii.run_sequence("sync_to_zenith")
     except ASCIIError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     return True
 
 
-@router.get("/park", response_model=bool, summary="Park the telescope")
+@router.get(
+    "/park",
+    response_model=bool,
+    summary="Park the telescope",
+    dependencies=[Depends(admission("ascii", "motion"))],
+)
 async def park(ascii: ASCII_Protocol = Depends(ascii)):
     """Parks the telescope at Zenith."""
 
@@ -131,23 +352,47 @@ async def park(ascii: ASCII_Protocol = Depends(ascii)):
     return True
 
 
-@router.get("/goto_cover", response_model=bool, summary="Goto cover position")
+@router.get(
+    "/goto_cover",
+    response_model=bool,
+    summary="Goto cover position",
+    dependencies=[Depends(admission("ascii", "motion"))],
+)
 async def goto_cover(ascii: ASCII_Protocol = Depends(ascii)):
     """Goes to the cover position."""
 
     try:
-        await ascii.send_command("UnPark")
-        await ascii.send_command("GoToAltAzStop 180 20")
-
-        await asyncio.sleep(70)
-        await ascii.send_command("Abort")
+        await ascii.run_sequence("goto_cover")
     except ASCIIError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     return True
 
 
-@router.get("/stop", response_model=bool, summary="Stops the telescope")
+@router.get(
+    "/sequence/{name}",
+    response_model=SequenceResponse,
+    summary="Run a command sequence",
+    dependencies=[Depends(admission("ascii", "motion"))],
+)
+async def sequence(name: str, ascii: ASCII_Protocol = Depends(ascii)):
+    """Runs a sequence defined in the configuration and returns its timings."""
+
+    if name not in ascii.sequences:
+        raise HTTPException(status_code=404, detail=f"Unknown sequence {name!r}.")
+
+    try:
+        return await ascii.run_sequence(name)
+    except ASCIIError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get(
+    "/stop",
+    response_model=bool,
+    summary="Stops the telescope",
+    dependencies=[Depends(admission("ascii", "safety"))],
+)
 async def stop(ascii: ASCII_Protocol = Depends(ascii)):
     """Stops the telescope."""
 
@@ -6,19 +6,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from contextlib import nullcontext
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
-from f1_tcs.dependencies import ascom
+from f1_tcs.admission import AdmissionRejected
+from f1_tcs.dependencies import admission, ascom, rejected_exception
+from f1_tcs.profiling import TimedRoute
+from f1_tcs.protocols.ascom import ASCOM_Protocol
+from f1_tcs.tools import etag_matches
 
 
 if TYPE_CHECKING:
-    from f1_tcs.protocols.ascom import ASCOM_Protocol
+    from f1_tcs.admission import AdmissionController
+    from f1_tcs.status import CachedSample
 
 
-router = APIRouter(prefix="/ascom", tags=["ascom"])
+router = APIRouter(prefix="/ascom", tags=["ascom"], route_class=TimedRoute)
 
 
 class ASCOMStatusResponse(BaseModel):
@@ -57,18 +64,21 @@ class ASCOMStatusResponse(BaseModel):
         list[str],
         Field(description="List of parameters with errors"),
     ]
+    sequence: Annotated[
+        int | None,
+        Field(description="Sequence number of the pointing sample"),
+    ] = None
 
 
-@router.get("/test")
+@router.get("/test", dependencies=[Depends(admission("ascom", "read"))])
 async def test(ascom: Annotated[ASCOM_Protocol, Depends(ascom)]):
     """Test the ASCOM connection."""
 
     return await ascom.test()
 
 
-@router.get("/pointing", response_model=ASCOMStatusResponse)
-async def status(ascom: Annotated[ASCOM_Protocol, Depends(ascom)]):
-    """Get the status of the telescope."""
+async def fetch_pointing(ascom: ASCOM_Protocol) -> dict[str, Any]:
+    """Fetches the pointing information from the ASCOM server."""
 
     try:
         data = await ascom.gather(
@@ -93,7 +103,7 @@ async def status(ascom: Annotated[ASCOM_Protocol, Depends(ascom)]):
     ):
         ha = data["siderealtime"]["result"] - data["rightascension"]["result"]
 
-    return ASCOMStatusResponse(
+    return dict(
         utcdate=data["utcdate"]["result"],
         sidereal_time=data["siderealtime"]["result"],
         ha=ha,
@@ -105,3 +115,60 @@ async def status(ascom: Annotated[ASCOM_Protocol, Depends(ascom)]):
         declination=data["declination"]["result"],
         errors=[key for key, value in data.items() if value["error_number"] != 0],
     )
+
+
+@router.get(
+    "/pointing",
+    response_model=ASCOMStatusResponse,
+    responses={304: {"description": "The pointing has not changed."}},
+)
+async def status(
+    request: Request,
+    response: Response,
+    ascom: Annotated[ASCOM_Protocol, Depends(ascom)],
+    after: Annotated[
+        int | None,
+        Query(description="Wait until the sequence number is larger than this."),
+    ] = None,
+    timeout: Annotated[
+        float,
+        Query(ge=0, le=60, description="Maximum time to wait when using after."),
+    ] = 30,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """Get the status of the telescope.
+
+    The pointing is cached for a short time and shared between requests. Each
+    sample has a sequence number and an ETag, and requests with a matching
+    ``If-None-Match`` header receive a 304 response. With ``after``, the request
+    waits until a sample with a larger sequence number is available or the
+    timeout is reached.
+
+    """
+
+    cache: CachedSample = request.app.state.pointing_cache
+
+    controllers = getattr(request.app.state, "admission", None) or {}
+    controller: AdmissionController | None = controllers.get("ascom")
+
+    async def fetch():
+        try:
+            async with controller.admit("read") if controller else nullcontext():
+                return await fetch_pointing(ascom)
+        except AdmissionRejected as err:
+            if cache.sample is not None:
+                return cache.sample
+            raise rejected_exception(err) from err
+
+    if after is not None:
+        sample = await cache.wait(fetch, after, timeout)
+    else:
+        sample = await cache.get(fetch)
+
+    etag = cache.version.etag
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+
+    return ASCOMStatusResponse(**sample, sequence=cache.version.sequence)
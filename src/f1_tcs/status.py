@@ -0,0 +1,535 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: status.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal
+
+from f1_tcs import config, logger
+from f1_tcs.telemetry import TelemetryRecorder
+from f1_tcs.tools import ScopeStatusDict, ScopeStatusMaskbit, parse_scope_status
+
+
+if TYPE_CHECKING:
+    from f1_tcs.protocols.ascii import ASCII_Protocol
+
+
+__all__ = [
+    "StatusPoller",
+    "StatusChangeDetector",
+    "StatusSubscription",
+    "SampleVersion",
+    "CachedSample",
+    "NUMERIC_FIELDS",
+]
+
+
+SubscriptionMode = Literal["all", "events", "deltas"]
+
+#: Numeric fields in the scope status that are tracked as deltas.
+NUMERIC_FIELDS: tuple[str, ...] = (
+    "right_ascension",
+    "declination",
+    "altitude",
+    "azimuth",
+    "secondary_axis_angle",
+    "primary_axis_angle",
+    "scope_sidereal_time",
+    "scope_julian_day",
+    "scope_time",
+    "air_mass",
+)
+
+
+class StatusChangeDetector:
+    """Compares consecutive status samples and emits events and deltas.
+
+    Parameters
+    ----------
+    deadbands
+        A mapping of numeric field name to the minimum absolute change, with
+        respect to the last reported value, that triggers a delta for that field.
+        Fields not in the mapping are reported on any change.
+
+    """
+
+    def __init__(self, deadbands: dict[str, float] | None = None):
+        self.deadbands = deadbands or {}
+
+        self.previous: ScopeStatusDict | None = None
+        self._reported: dict[str, float] = {}
+
+    def reset(self):
+        """Forgets the previous sample."""
+
+        self.previous = None
+        self._reported = {}
+
+    def update(
+        self,
+        sample: ScopeStatusDict,
+        timestamp: float | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Processes a new sample.
+
+        Returns a tuple with the list of mask bit events and the numeric delta
+        (or ``None`` if no field changed beyond its deadband). The first sample
+        after a reset does not generate events or deltas.
+
+        """
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        events: list[dict[str, Any]] = []
+        changes: dict[str, float] = {}
+
+        if self.previous is None:
+            self.previous = sample
+            self._reported = {field: sample[field] for field in NUMERIC_FIELDS}
+            return events, None
+
+        changed_bits = self.previous["bool_params"] ^ sample["bool_params"]
+        for bit in ScopeStatusMaskbit:
+            if changed_bits & bit:
+                events.append(
+                    {
+                        "type": "event",
+                        "timestamp": timestamp,
+                        "bit": bit.name,
+                        "state": "set" if sample["bool_params"] & bit else "cleared",
+                    }
+                )
+
+        for field in NUMERIC_FIELDS:
+            value = sample[field]
+            if abs(value - self._reported[field]) > self.deadbands.get(field, 0.0):
+                changes[field] = value
+                self._reported[field] = value
+
+        self.previous = sample
+
+        if len(changes) == 0:
+            return events, None
+
+        return events, {"type": "delta", "timestamp": timestamp, "changes": changes}
+
+
+class SampleVersion:
+    """A monotonic sequence number and ETag for a stream of samples.
+
+    The sequence number is increased by the owner of the instance when a sample
+    differs meaningfully from the previous one. The ETag is weak, since samples
+    with the same sequence number may differ within the deadbands.
+
+    """
+
+    def __init__(self):
+        self.sequence: int = 0
+
+        # Distinguishes the sequence numbers of different server runs.
+        self._epoch = f"{os.getpid():x}{time.time_ns():x}"
+        self._changed = asyncio.Event()
+
+    @property
+    def etag(self) -> str:
+        """The ETag for the current sequence number."""
+
+        return f'W/"{self._epoch}-{self.sequence}"'
+
+    def bump(self):
+        """Increases the sequence number and wakes up the waiters."""
+
+        self.sequence += 1
+
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self, after: int, timeout: float) -> bool:
+        """Waits until the sequence number is larger than ``after``.
+
+        Returns ``False`` if the timeout is reached before that happens.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while self.sequence <= after:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+
+        return True
+
+
+class CachedSample:
+    """Caches a sample that is expensive to fetch and tracks its version.
+
+    The sample is refetched only if it is older than ``max_age``. Concurrent
+    callers share a single fetch and receive its result or its exception, so a
+    failing backend is queried once for all of them. The sequence number is
+    increased when any field, other than those in ``ignore``, changes.
+
+    Parameters
+    ----------
+    max_age
+        Maximum age, in seconds, of the cached sample.
+    ignore
+        Fields that are not considered when deciding whether the sample changed.
+
+    """
+
+    def __init__(self, max_age: float = 1.0, ignore: list[str] | None = None):
+        self.max_age = max_age
+        self.ignore = set(ignore or [])
+
+        self.version = SampleVersion()
+
+        self.sample: dict[str, Any] | None = None
+        self.sample_time: float = 0.0
+
+        self._fetching: asyncio.Task[dict[str, Any]] | None = None
+
+    async def get(
+        self,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Returns the cached sample, calling ``fetch`` if it is too old."""
+
+        age = time.monotonic() - self.sample_time
+        if self.sample is not None and age <= self.max_age:
+            return self.sample
+
+        if self._fetching is None:
+            self._fetching = asyncio.create_task(self._fetch(fetch))
+
+        # A caller that is cancelled does not cancel the fetch for the others.
+        return await asyncio.shield(self._fetching)
+
+    async def _fetch(
+        self,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Fetches and caches a new sample."""
+
+        try:
+            self.update(await fetch())
+        finally:
+            self._fetching = None
+
+        assert self.sample is not None
+
+        return self.sample
+
+    def update(self, sample: dict[str, Any]):
+        """Replaces the cached sample."""
+
+        def significant(data: dict[str, Any] | None):
+            if data is None:
+                return None
+            return {key: value for key, value in data.items() if key not in self.ignore}
+
+        if significant(sample) != significant(self.sample):
+            self.version.bump()
+
+        self.sample = sample
+        self.sample_time = time.monotonic()
+
+    async def wait(
+        self,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        after: int,
+        timeout: float,
+    ) -> dict[str, Any]:
+        """Refreshes the sample until its sequence number is larger than ``after``.
+
+        Returns the latest sample when that happens or after ``timeout`` seconds.
+
+        """
+
+        deadline = time.monotonic() + timeout
+
+        sample = await self.get(fetch)
+        while self.version.sequence <= after and time.monotonic() < deadline:
+            await asyncio.sleep(self.max_age)
+            sample = await self.get(fetch)
+
+        return sample
+
+
+class StatusSubscription:
+    """A subscriber to the stream of status events and deltas.
+
+    Messages are buffered in a bounded queue. If the subscriber does not keep up,
+    the queued messages are replaced by a ``snapshot`` of the current status,
+    with the total number of dropped messages, so that the subscriber can resync
+    instead of missing events. Without a ``snapshot`` callback, the oldest
+    message is dropped.
+
+    Parameters
+    ----------
+    mode
+        The type of messages to receive (``all``, ``events``, or ``deltas``).
+        Snapshots are always received.
+    maxsize
+        The maximum number of queued messages.
+    snapshot
+        A callback that returns a ``snapshot`` message with the current status.
+
+    """
+
+    def __init__(
+        self,
+        mode: SubscriptionMode = "all",
+        maxsize: int = 100,
+        snapshot: Callable[[], dict[str, Any]] | None = None,
+    ):
+        self.mode = mode
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
+        self.snapshot = snapshot
+        self.dropped: int = 0
+
+    def wants(self, message: dict[str, Any]) -> bool:
+        """Returns whether the subscriber wants a message of this type."""
+
+        if message["type"] == "snapshot" or self.mode == "all":
+            return True
+
+        return message["type"] == self.mode.rstrip("s")
+
+    def put(self, message: dict[str, Any]):
+        """Queues a message, resyncing the subscriber if the queue is full."""
+
+        if not self.wants(message):
+            return
+
+        if self.queue.full():
+            if self.snapshot is None:
+                self.queue.get_nowait()
+                self.dropped += 1
+            else:
+                # The snapshot already includes the change in this message.
+                self.dropped += self.queue.qsize() + 1
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+
+                message = {**self.snapshot(), "dropped": self.dropped}
+
+        self.queue.put_nowait(message)
+
+    async def get(self) -> dict[str, Any]:
+        """Waits for the next message."""
+
+        return await self.queue.get()
+
+
+class StatusPoller:
+    """Periodically polls the ASCII status and notifies subscribers of changes.
+
+    Parameters
+    ----------
+    ascii
+        The ``ASCII_Protocol`` instance used to poll the status.
+    interval
+        The polling interval, in seconds.
+    deadbands
+        Deadbands for the numeric fields. See `.StatusChangeDetector`.
+    version_ignore
+        Numeric fields whose changes do not increase the sequence number of the
+        samples. The right ascension is also ignored when the telescope is not
+        tracking, since it changes continuously with the sidereal time.
+    recorder
+        A `.TelemetryRecorder` to which all the samples are sent.
+
+    """
+
+    def __init__(
+        self,
+        ascii: ASCII_Protocol,
+        interval: float = 1.0,
+        deadbands: dict[str, float] | None = None,
+        version_ignore: list[str] | None = None,
+        recorder: TelemetryRecorder | None = None,
+    ):
+        self.ascii = ascii
+        self.interval = interval
+        self.version_ignore = set(version_ignore or [])
+        self.recorder = recorder
+
+        self.detector = StatusChangeDetector(deadbands)
+        self.subscriptions: set[StatusSubscription] = set()
+
+        self.latest: ScopeStatusDict | None = None
+        self.latest_time: float | None = None
+
+        # Increased on each sample that generates events or deltas in fields not
+        # in version_ignore.
+        self.version = SampleVersion()
+
+        self._task: asyncio.Task | None = None
+        self._failing: bool = False
+
+    @classmethod
+    def from_config(cls, ascii: ASCII_Protocol) -> StatusPoller:
+        """Creates a poller using the ``status`` section of the configuration."""
+
+        status_config = config.get("status", {})
+
+        return cls(
+            ascii,
+            interval=status_config.get("poll_interval", 1.0),
+            deadbands=status_config.get("deadbands", {}),
+            version_ignore=status_config.get("version_ignore", []),
+            recorder=TelemetryRecorder.from_config(),
+        )
+
+    def start(self):
+        """Starts the polling loop."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self):
+        """Stops the polling loop."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = None
+
+        if self.recorder is not None:
+            self.recorder.flush()
+
+    def subscribe(
+        self,
+        mode: SubscriptionMode = "all",
+        maxsize: int = 100,
+    ) -> StatusSubscription:
+        """Registers a new subscriber.
+
+        If a sample is already available, it is queued as a ``snapshot`` message
+        so that the subscriber has a baseline against which to apply deltas.
+
+        """
+
+        subscription = StatusSubscription(
+            mode=mode,
+            maxsize=maxsize,
+            snapshot=self._snapshot,
+        )
+        self.subscriptions.add(subscription)
+
+        if self.latest is not None:
+            subscription.put(self._snapshot())
+
+        return subscription
+
+    def unsubscribe(self, subscription: StatusSubscription):
+        """Removes a subscriber."""
+
+        self.subscriptions.discard(subscription)
+
+    def get_latest(self, max_age: float) -> ScopeStatusDict | None:
+        """Returns the latest sample if it is not older than ``max_age`` seconds."""
+
+        if self.latest is None or self.latest_time is None:
+            return None
+
+        if time.time() - self.latest_time > max_age:
+            return None
+
+        return self.latest
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Returns a snapshot message with the latest sample."""
+
+        return {
+            "type": "snapshot",
+            "timestamp": self.latest_time,
+            "sequence": self.version.sequence,
+            "status": self.latest,
+        }
+
+    def _publish(self, message: dict[str, Any]):
+        """Sends a message to all subscribers."""
+
+        message["sequence"] = self.version.sequence
+
+        for subscription in self.subscriptions:
+            subscription.put(message)
+
+    def process(self, sample: ScopeStatusDict, timestamp: float | None = None):
+        """Processes a new sample and notifies the subscribers."""
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        events, delta = self.detector.update(sample, timestamp=timestamp)
+
+        if self.latest is None or len(events) > 0 or self._changed(sample, delta):
+            self.version.bump()
+
+        self.latest = sample
+        self.latest_time = timestamp
+
+        if self.recorder is not None:
+            self.recorder.record(sample, timestamp)
+
+        for event in events:
+            self._publish(event)
+
+        if delta is not None:
+            self._publish(delta)
+
+    def _changed(self, sample: ScopeStatusDict, delta: dict[str, Any] | None) -> bool:
+        """Returns whether a delta changes the version of the samples."""
+
+        if delta is None:
+            return False
+
+        ignore = set(self.version_ignore)
+        if not sample["bool_params"] & ScopeStatusMaskbit.TRACKING:
+            ignore.add("right_ascension")
+
+        return any(field not in ignore for field in delta["changes"])
+
+    async def poll(self):
+        """Polls the status once."""
+
+        status = await self.ascii.send_command("ReadScopeStatus")
+        self.process(parse_scope_status(status))
+
+    async def _poll_loop(self):
+        """Polls the status every ``interval`` seconds."""
+
+        while True:
+            try:
+                await self.poll()
+            except Exception as err:
+                if not self._failing:
+                    logger.warning("Failed polling the ASCII status: %s", err)
+                    self._failing = True
+            else:
+                if self._failing:
+                    logger.info("ASCII status polling recovered.")
+                    self._failing = False
+
+            await asyncio.sleep(self.interval)
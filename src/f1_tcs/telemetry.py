@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: telemetry.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import io
+import pathlib
+import threading
+
+from typing import TYPE_CHECKING
+
+import numpy
+
+from f1_tcs import config, logger
+
+
+if TYPE_CHECKING:
+    from f1_tcs.tools import ScopeStatusDict
+
+
+__all__ = ["TelemetryRecorder", "COLUMNS", "get_night", "load_night", "list_nights"]
+
+
+#: Columns in the telemetry files.
+COLUMNS: tuple[str, ...] = (
+    "time",
+    "bool_params",
+    "right_ascension",
+    "declination",
+    "altitude",
+    "azimuth",
+    "secondary_axis_angle",
+    "primary_axis_angle",
+    "scope_sidereal_time",
+    "scope_julian_day",
+    "scope_time",
+    "air_mass",
+)
+
+
+def get_night(timestamp: float, utc_offset: float = 0.0) -> str:
+    """Returns the night (``YYYY-MM-DD``) to which a UNIX timestamp belongs.
+
+    The night is the local date at the start of the night, so samples are
+    assigned to the previous date until local noon.
+
+    """
+
+    local = timestamp + (utc_offset - 12) * 3600
+    date = datetime.datetime.fromtimestamp(local, tz=datetime.timezone.utc).date()
+
+    return date.isoformat()
+
+
+def list_nights(path: str | pathlib.Path) -> list[str]:
+    """Returns the nights with telemetry files in a directory."""
+
+    return sorted(file.stem for file in pathlib.Path(path).glob("*.csv"))
+
+
+def load_night(file: str | pathlib.Path) -> numpy.ndarray:
+    """Loads a telemetry file as a 2D array with one column for each of `.COLUMNS`.
+
+    Incomplete trailing lines are ignored and the rows are sorted by time.
+
+    """
+
+    text = pathlib.Path(file).read_text()
+
+    # Skip the header and any line that is still being written.
+    text = text[text.find("\n") + 1 : text.rfind("\n") + 1]
+    if text == "":
+        return numpy.empty((0, len(COLUMNS)))
+
+    data = numpy.loadtxt(io.StringIO(text), delimiter=",", ndmin=2)
+
+    return data[numpy.argsort(data[:, 0], kind="stable")]
+
+
+class TelemetryRecorder:
+    """Records status samples to one CSV file per night.
+
+    Samples are buffered and written in a worker thread every ``flush_every``
+    samples, so disk I/O does not block the event loop.
+
+    Parameters
+    ----------
+    path
+        The directory in which to write the files.
+    flush_every
+        The number of samples to buffer before writing them to disk.
+    utc_offset
+        The offset of the local time with respect to UTC, in hours. Used to
+        assign samples to nights.
+    max_nights
+        The number of nights to keep. When a new night file is created, the
+        oldest files over this number are deleted. If ``None``, all the files
+        are kept.
+
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        flush_every: int = 60,
+        utc_offset: float = 0.0,
+        max_nights: int | None = None,
+    ):
+        self.path = pathlib.Path(path).expanduser()
+        self.flush_every = flush_every
+        self.utc_offset = utc_offset
+        self.max_nights = max_nights
+
+        self._buffer: dict[str, list[str]] = {}
+        self._n_buffered: int = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> TelemetryRecorder | None:
+        """Creates a recorder from the configuration, or ``None`` if disabled."""
+
+        telemetry_config = config.get("telemetry", {})
+        if not telemetry_config.get("enabled", False):
+            return None
+
+        return cls(
+            telemetry_config["path"],
+            flush_every=telemetry_config.get("flush_every", 60),
+            utc_offset=telemetry_config.get("utc_offset", 0.0),
+            max_nights=telemetry_config.get("max_nights", None),
+        )
+
+    def get_file(self, night: str) -> pathlib.Path:
+        """Returns the path to the file for a night."""
+
+        return self.path / f"{night}.csv"
+
+    def record(self, sample: ScopeStatusDict, timestamp: float):
+        """Buffers a sample and schedules a write if the buffer is full."""
+
+        values = [sample[column] for column in COLUMNS[1:]]  # type: ignore
+        row = ",".join(map(repr, [timestamp, *values]))
+
+        night = get_night(timestamp, self.utc_offset)
+        self._buffer.setdefault(night, []).append(row)
+        self._n_buffered += 1
+
+        if self._n_buffered >= self.flush_every:
+            buffer = self._take_buffer()
+            asyncio.get_running_loop().run_in_executor(None, self._write, buffer)
+
+    def flush(self):
+        """Writes all the buffered samples. Blocks until done."""
+
+        self._write(self._take_buffer())
+
+    def _take_buffer(self) -> dict[str, list[str]]:
+        """Returns the buffered rows and empties the buffer."""
+
+        buffer = self._buffer
+        self._buffer = {}
+        self._n_buffered = 0
+
+        return buffer
+
+    def _write(self, buffer: dict[str, list[str]]):
+        """Appends rows to the night files."""
+
+        try:
+            with self._lock:
+                self.path.mkdir(parents=True, exist_ok=True)
+                for night, rows in buffer.items():
+                    file = self.get_file(night)
+                    new_file = not file.exists()
+                    with open(file, "a") as fd:
+                        if new_file:
+                            fd.write(",".join(COLUMNS) + "\n")
+                        fd.write("\n".join(rows) + "\n")
+                    if new_file:
+                        self._prune()
+        except Exception as err:
+            logger.error("Failed writing telemetry: %s", err)
+
+    def _prune(self):
+        """Deletes the oldest night files over ``max_nights``."""
+
+        if self.max_nights is None:
+            return
+
+        nights = list_nights(self.path)
+        for night in nights[: max(0, len(nights) - self.max_nights)]:
+            self.get_file(night).unlink(missing_ok=True)
+            logger.info("Deleted telemetry for night %s.", night)
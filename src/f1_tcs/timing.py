@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: timing.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+from typing import Iterator
+
+
+__all__ = ["RequestTimer", "request_timer", "measure"]
+
+
+class RequestTimer:
+    """Collects the timing breakdown of a request.
+
+    Overlapping measurements of the same metric (e.g., concurrent upstream calls)
+    are merged, so each metric is the wall time during which at least one
+    measurement was active.
+
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+
+        self.metrics: dict[str, float] = {}
+
+        # Points in time used to derive metrics (e.g., when the endpoint returned).
+        self.marks: dict[str, float] = {}
+
+        self._active: dict[str, int] = {}
+        self._started: dict[str, float] = {}
+
+    def begin(self, name: str):
+        """Starts measuring a metric."""
+
+        if self._active.get(name, 0) == 0:
+            self._started[name] = time.perf_counter()
+
+        self._active[name] = self._active.get(name, 0) + 1
+
+    def end(self, name: str):
+        """Stops measuring a metric started with `.begin`."""
+
+        self._active[name] -= 1
+
+        if self._active[name] == 0:
+            elapsed = time.perf_counter() - self._started.pop(name)
+            self.metrics[name] = self.metrics.get(name, 0.0) + elapsed
+
+    def add(self, name: str, elapsed: float):
+        """Adds a duration to a metric."""
+
+        self.metrics[name] = self.metrics.get(name, 0.0) + elapsed
+
+    def server_timing(self) -> str:
+        """Returns the value of the ``Server-Timing`` header, in milliseconds."""
+
+        metrics = dict(self.metrics)
+        metrics["total"] = time.perf_counter() - self.start
+
+        return ", ".join(
+            f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in metrics.items()
+        )
+
+
+#: The timer for the request being processed, if any.
+request_timer: contextvars.ContextVar[RequestTimer | None] = contextvars.ContextVar(
+    "request_timer",
+    default=None,
+)
+
+
+@contextmanager
+def measure(name: str) -> Iterator[None]:
+    """Measures a block of code in the timer of the current request, if any."""
+
+    timer = request_timer.get()
+    if timer is None:
+        yield
+        return
+
+    timer.begin(name)
+    try:
+        yield
+    finally:
+        timer.end(name)
@@ -13,7 +13,12 @@ import enum
 from typing import TypedDict
 
 
-__all__ = ["ScopeStatusMaskbit", "ScopeStatusDict", "parse_scope_status"]
+__all__ = [
+    "ScopeStatusMaskbit",
+    "ScopeStatusDict",
+    "parse_scope_status",
+    "etag_matches",
+]
 
 
 class ScopeStatusMaskbit(enum.IntFlag):
@@ -138,3 +143,23 @@ def parse_scope_status(status: str) -> ScopeStatusDict:
         scope_time=float(items[9]),
         air_mass=float(items[10]),
     )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Checks whether an ``If-None-Match`` header matches an ETag.
+
+    Uses the weak comparison from RFC 9110, so ``W/`` prefixes are ignored.
+
+    """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    def strip_weak(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return strip_weak(etag) in map(strip_weak, if_none_match.split(","))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: conftest.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from f1_tcs import config
+
+
+#: A parked telescope.
+PARKED_STATUS = "17;12.5;30.0;89.9;180.0;0.0;0.0;12.5;2461000.5;4.0;1.0;_"
+
+
+class FakeController:
+    """A fake F1 ASCII server that records the commands it receives.
+
+    Runs in its own thread and event loop, so it can be used both from async
+    tests and with the FastAPI test client.
+
+    """
+
+    def __init__(self):
+        self.commands: list[str] = []
+        self.status = PARKED_STATUS
+
+        # Time to wait before replying to a command, by command name.
+        self.delays: dict[str, float] = {}
+
+        self.port: int = 0
+        self._writers: list[asyncio.StreamWriter] = []
+
+        self._loop = asyncio.new_event_loop()
+        self._server: asyncio.Server | None = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait(5)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    @property
+    def command_names(self) -> list[str]:
+        return [command.split(" ")[0] for command in self.commands]
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+
+        self._loop.run_forever()
+
+    async def _shutdown(self):
+        assert self._server is not None
+
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.append(writer)
+
+        while line := await reader.readline():
+            command = line.decode().strip()
+            self.commands.append(command)
+
+            name = command.split(" ")[0]
+            await asyncio.sleep(self.delays.get(name, 0))
+
+            if name in ("ReadScopeStatus", "ReadScopeDestination"):
+                reply = self.status
+            else:
+                reply = f"{name} OK"
+
+            writer.write(f"{reply}\n".encode())
+            await writer.drain()
+
+        writer.close()
+
+
+@pytest.fixture()
+def controller() -> Iterator[FakeController]:
+    fake = FakeController()
+    fake.start()
+
+    yield fake
+
+    fake.stop()
+
+
+@pytest.fixture()
+def client(
+    controller: FakeController,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[TestClient]:
+    """A test client for the app connected to the fake controller."""
+
+    monkeypatch.setenv("F1_TCS_SIMULATOR", "true")
+    monkeypatch.setitem(config["f1_ascii"]["simulator"], "port", controller.port)
+    monkeypatch.setitem(config["telemetry"], "enabled", False)
+
+    from f1_tcs.app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_admission.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from f1_tcs import config
+from f1_tcs.admission import AdmissionController, AdmissionRejected
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from .conftest import FakeController
+
+
+async def test_queue_limit():
+    controller = AdmissionController({"read": {"max_concurrency": 1, "max_queue": 1}})
+
+    async with controller.admit("read"):
+        queued = asyncio.create_task(controller.acquire("read"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejected, match="queued"):
+            await controller.acquire("read")
+
+    controller.release("read", await queued)
+
+    stats = controller.get_stats()["read"]
+    assert stats["n_admitted"] == 2
+    assert stats["n_rejected"] == 1
+
+
+async def test_queue_limit_with_free_slots():
+    controller = AdmissionController({"read": {"max_concurrency": 2, "max_queue": 0}})
+
+    async with controller.admit("read"):
+        async with controller.admit("read"):
+            with pytest.raises(AdmissionRejected):
+                await controller.acquire("read")
+
+
+async def test_estimated_wait_before_first_release():
+    limits = {"motion": {"max_concurrency": 1, "max_wait": 5, "service_time": 3}}
+    controller = AdmissionController(limits)
+
+    async with controller.admit("motion"):
+        # One request waiting is within max_wait, a second one is not.
+        queued = asyncio.create_task(controller.acquire("motion"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejected, match="wait") as err:
+            await controller.acquire("motion")
+
+        assert err.value.retry_after == 6
+
+    controller.release("motion", await queued)
+
+
+async def test_safety_always_admitted():
+    controller = AdmissionController({"motion": {"max_concurrency": 1, "max_queue": 0}})
+
+    async with controller.admit("motion"):
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("motion")
+
+        async with controller.admit("safety"):
+            pass
+
+
+def test_motion_saturated(client: TestClient, controller: FakeController):
+    limits = {"motion": {"max_concurrency": 1, "max_queue": 1, "service_time": 1}}
+    client.app.state.admission["ascii"] = AdmissionController(limits)  # type: ignore
+
+    controller.delays["Park"] = 0.6
+
+    with ThreadPoolExecutor(2) as pool:
+        running = pool.submit(client.get, "/ascii/park")
+        time.sleep(0.2)
+        queued = pool.submit(client.get, "/ascii/park")
+        time.sleep(0.2)
+
+        response = client.get("/ascii/park")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+
+        # Stopping the telescope is always admitted.
+        response = client.get("/ascii/stop")
+        assert response.status_code == 200
+        assert "Abort" in controller.commands
+
+        assert running.result().status_code == 200
+        assert queued.result().status_code == 200
+
+
+def test_status_fallback(
+    client: TestClient,
+    controller: FakeController,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    limits = {"read": {"max_concurrency": 1, "max_queue": 0}}
+    client.app.state.admission["ascii"] = AdmissionController(limits)  # type: ignore
+
+    poller = client.app.state.status_poller  # type: ignore
+
+    t0 = time.time()
+    while poller.latest is None and time.time() - t0 < 2:
+        time.sleep(0.01)
+
+    # Always query the controller instead of serving the polled sample.
+    monkeypatch.setitem(config["status"], "max_age", -1)
+    controller.delays["ReadScopeStatus"] = 0.5
+
+    with ThreadPoolExecutor(1) as pool:
+        running = pool.submit(client.get, "/ascii/status")
+        time.sleep(0.1)
+
+        # The read is rejected and the latest polled sample is returned instead.
+        t0 = time.time()
+        response = client.get("/ascii/status")
+        assert response.status_code == 200
+        assert time.time() - t0 < 0.3
+        assert response.json()["bool_params"] == poller.latest["bool_params"]
+
+        assert running.result().status_code == 200
+
+    stats = client.get("/admin/admission").json()
+    assert stats["ascii"]["read"]["n_rejected"] == 1
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_ascii.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from f1_tcs.guiding import GuideCorrector
+from f1_tcs.protocols.ascii import ASCII_Protocol, ASCIIError
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from .conftest import FakeController
+
+
+SEQUENCES = {
+    "goto_cover": ["UnPark", "GoToAltAzStop 180 20", {"wait": 5}, "Abort"],
+    "sync_to_zenith": ["UnPark", "SyncToAltAz 0 89.9", "MotorsToAuto", "Park"],
+}
+
+
+@pytest.fixture()
+async def ascii(controller: FakeController):
+    protocol = ASCII_Protocol("127.0.0.1", controller.port, sequences=SEQUENCES)
+
+    yield protocol
+
+    await protocol.disconnect()
+
+
+async def test_abort_fails_queued_sequence(
+    ascii: ASCII_Protocol,
+    controller: FakeController,
+):
+    running = asyncio.create_task(ascii.run_sequence("goto_cover"))
+    await asyncio.sleep(0.1)
+
+    queued = asyncio.create_task(ascii.run_sequence("sync_to_zenith"))
+    await asyncio.sleep(0.1)
+
+    await ascii.send_command("Abort")
+
+    for task in (running, queued):
+        with pytest.raises(ASCIIError):
+            await task
+
+    assert controller.command_names == ["UnPark", "GoToAltAzStop", "Abort"]
+
+
+async def test_abort_fails_queued_commands(
+    ascii: ASCII_Protocol,
+    controller: FakeController,
+):
+    running = asyncio.create_task(ascii.run_sequence("goto_cover"))
+    await asyncio.sleep(0.1)
+
+    park = asyncio.create_task(ascii.send_command("Park"))
+    await asyncio.sleep(0.1)
+
+    await ascii.send_command("Abort")
+
+    with pytest.raises(ASCIIError):
+        await park
+
+    await asyncio.gather(running, return_exceptions=True)
+
+    # Commands sent after the Abort are not affected.
+    await ascii.send_command("Park")
+
+    assert controller.command_names == ["UnPark", "GoToAltAzStop", "Abort", "Park"]
+
+
+async def test_abort_fails_queued_guide_corrections(
+    ascii: ASCII_Protocol,
+    controller: FakeController,
+):
+    corrections = {"guide": {"merge": "sum", "command": "Jog {direction} {value}"}}
+    corrector = GuideCorrector(ascii, corrections)
+    corrector.start()
+
+    running = asyncio.create_task(ascii.run_sequence("goto_cover"))
+    await asyncio.sleep(0.1)
+
+    # The first correction waits for the sequence in send_command and the second
+    # one in the corrector.
+    first = corrector.submit("guide", ra=1)
+    await asyncio.sleep(0.1)
+    second = corrector.submit("guide", ra=1)
+
+    await ascii.send_command("Abort")
+    await asyncio.gather(running, return_exceptions=True)
+
+    for future in (first, second):
+        result = await asyncio.wait_for(future, 1)
+        assert result["error"] is not None
+
+    assert "Jog" not in controller.command_names
+
+    await corrector.stop()
+
+
+async def test_invalid_sequence():
+    with pytest.raises(ASCIIError):
+        ASCII_Protocol("127.0.0.1", 0, sequences={"bad": [{"until": {"set": "SLEW"}}]})
+
+    ascii = ASCII_Protocol("127.0.0.1", 0)
+    with pytest.raises(ASCIIError):
+        await ascii.run_sequence([{"until": {"clear": "PARKD"}}])
+
+
+async def test_abort_goes_ahead_of_queued_commands(
+    ascii: ASCII_Protocol,
+    controller: FakeController,
+):
+    controller.delays["ReadScopeStatus"] = 0.1
+
+    reads = [asyncio.create_task(ascii.send_command("ReadScopeStatus"))]
+    await asyncio.sleep(0.02)
+
+    reads += [
+        asyncio.create_task(ascii.send_command("ReadScopeStatus")) for _ in range(5)
+    ]
+    await asyncio.sleep(0.02)
+
+    await ascii.send_command("Abort")
+
+    # Only the read that was already being sent goes before the Abort.
+    assert controller.command_names[:2] == ["ReadScopeStatus", "Abort"]
+
+    await asyncio.gather(*reads)
+    assert len(controller.commands) == 7
+
+
+async def test_commands_pipelined(ascii: ASCII_Protocol, controller: FakeController):
+    await ascii.connect()
+    assert ascii.writer is not None
+
+    writes: list[bytes] = []
+    write = ascii.writer.write
+
+    def record_write(data: bytes):
+        writes.append(data)
+        write(data)
+
+    ascii.writer.write = record_write  # type: ignore
+
+    # A slow first reply must not shift the replies of the following commands.
+    controller.delays["UnPark"] = 0.1
+
+    result = await ascii.run_sequence(["UnPark", "SyncToAltAz 0 89.9", "MotorsToAuto"])
+
+    assert writes == [b"UnPark\nSyncToAltAz 0 89.9\nMotorsToAuto\n"]
+    assert [step["response"] for step in result["steps"]] == [
+        "UnPark OK",
+        "SyncToAltAz OK",
+        "MotorsToAuto OK",
+    ]
+
+
+async def test_sequence_elapsed(ascii: ASCII_Protocol, controller: FakeController):
+    controller.delays["Park"] = 0.05
+
+    result = await ascii.run_sequence(["UnPark", {"wait": 0.2}, "Park"])
+
+    assert result["name"] == "custom"
+    assert [step["step"] for step in result["steps"]] == ["UnPark", "wait 0.2", "Park"]
+
+    unpark, wait, park = result["steps"]
+    assert wait["response"] is None
+    assert 0.2 <= wait["elapsed"] < 0.3
+    assert park["elapsed"] >= 0.05
+    assert unpark["elapsed"] > 0
+
+    assert result["elapsed"] >= unpark["elapsed"] + wait["elapsed"] + park["elapsed"]
+
+
+async def test_sequence_until(ascii: ASCII_Protocol, controller: FakeController):
+    result = await ascii.run_sequence([{"until": {"set": "PARKED", "timeout": 1}}])
+    assert result["steps"][0]["step"] == "until PARKED set"
+
+    condition = {"clear": "PARKED", "timeout": 0.2, "interval": 0.05}
+    with pytest.raises(ASCIIError, match="Timed out"):
+        await ascii.run_sequence([{"until": condition}])
+
+    assert controller.command_names.count("ReadScopeStatus") > 2
+
+
+def test_sequence_unknown(client: TestClient):
+    response = client.get("/ascii/sequence/unknown")
+
+    assert response.status_code == 404
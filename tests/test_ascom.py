@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_ascom.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from f1_tcs.admission import AdmissionController
+from f1_tcs.dependencies import ascom
+from f1_tcs.status import CachedSample
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+class FakeASCOM:
+    """Returns a parked pointing with a drifting RA and sidereal time."""
+
+    def __init__(self):
+        self.n_calls: int = 0
+        self.azimuth: float = 180.0
+
+    async def gather(self, *paths: str, raise_on_error: bool = True):
+        self.n_calls += 1
+
+        values = {
+            "utcdate": f"2026-10-19T00:00:{self.n_calls:02d}",
+            "siderealtime": 1.0 + self.n_calls * 0.001,
+            "altitude": 89.9,
+            "azimuth": self.azimuth,
+            "rightascension": 1.0 + self.n_calls * 0.001,
+            "declination": 30.0,
+        }
+
+        return {path: {"result": values[path], "error_number": 0} for path in paths}
+
+
+def test_pointing_etag(client: TestClient):
+    fake = FakeASCOM()
+    client.app.dependency_overrides[ascom] = lambda: fake  # type: ignore
+
+    response = client.get("/ascom/pointing")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["azimuth"] == 180.0
+
+    etag = response.headers["ETag"]
+
+    # Within max_age the cached sample is served.
+    response = client.get("/ascom/pointing", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert fake.n_calls == 1
+
+    # The fields that drift while parked do not change the ETag.
+    client.app.state.pointing_cache.sample_time = 0  # type: ignore
+    response = client.get("/ascom/pointing", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert fake.n_calls == 2
+
+    # Long-poll until the telescope moves.
+    fake.azimuth = 90.0
+    response = client.get(
+        "/ascom/pointing",
+        params={"after": data["sequence"], "timeout": 5},
+    )
+    assert response.status_code == 200
+    assert response.json()["azimuth"] == 90.0
+    assert response.json()["sequence"] == data["sequence"] + 1
+    assert response.headers["ETag"] != etag
+
+    client.app.dependency_overrides.clear()  # type: ignore
+
+
+async def test_cached_sample_failing_backend_under_load():
+    cache = CachedSample(max_age=1)
+    controller = AdmissionController({"read": {"max_concurrency": 4, "max_queue": 20}})
+
+    n_calls = 0
+
+    async def fetch():
+        nonlocal n_calls
+
+        async with controller.admit("read"):
+            n_calls += 1
+            await asyncio.sleep(0.2)
+            raise ConnectionError("Backend is down.")
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(
+        *[cache.get(fetch) for _ in range(8)],
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - t0
+
+    # All the callers share one fetch and fail at the same time.
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert n_calls == 1
+    assert elapsed < 0.4
+
+    # The failure is not cached.
+    with pytest.raises(ConnectionError):
+        await cache.get(fetch)
+    assert n_calls == 2
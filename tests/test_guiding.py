@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_guiding.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from f1_tcs.guiding import GuideCorrector, GuideCorrectorError
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from .conftest import FakeController
+
+
+class SlowASCII:
+    """Records the commands and blocks until released."""
+
+    def __init__(self):
+        self.commands: list[str] = []
+        self.release = asyncio.Event()
+        self.abort_generation = 0
+
+    async def send_command(self, command: str) -> str:
+        self.commands.append(command)
+        await self.release.wait()
+        return "OK"
+
+
+CORRECTIONS = {
+    "guide": {"merge": "latest", "command": "Jog {direction} {value:.1f}"},
+    "offset": {
+        "merge": "sum",
+        "command": "Jog {direction} {value:.1f}",
+        "max_value": 5,
+    },
+}
+
+
+async def test_latest_supersedes_when_full():
+    ascii = SlowASCII()
+    corrector = GuideCorrector(ascii, CORRECTIONS, max_pending=1)  # type: ignore
+    corrector.start()
+
+    # The first correction is dispatched and blocks the dispatcher.
+    first = corrector.submit("guide", ra=1)
+    await asyncio.sleep(0.01)
+
+    old = corrector.submit("guide", ra=2)
+    newest = corrector.submit("guide", ra=3)
+
+    assert old.done() and old.result()["superseded"]
+    assert corrector.n_superseded == 1
+
+    # Sum corrections cannot be superseded and are still rejected.
+    with pytest.raises(GuideCorrectorError):
+        corrector.submit("offset", ra=1)
+
+    ascii.release.set()
+
+    assert (await first)["commands"] == ["Jog E 1.0"]
+    assert (await newest)["commands"] == ["Jog E 3.0"]
+
+    await corrector.stop()
+
+
+async def test_bad_template_resolves_futures():
+    ascii = SlowASCII()
+    ascii.release.set()
+
+    corrections = {"guide": {"merge": "latest", "command": "Jog {bad}"}}
+    corrector = GuideCorrector(ascii, corrections)  # type: ignore
+    corrector.start()
+
+    result = await asyncio.wait_for(corrector.submit("guide", ra=1), 1)
+    assert result["error"] is not None
+
+    # The dispatcher is still running.
+    corrector.corrections["guide"]["command"] = "Jog {direction} {value:.1f}"
+    result = await asyncio.wait_for(corrector.submit("guide", dec=-1), 1)
+    assert result["commands"] == ["Jog S 1.0"]
+
+    await corrector.stop()
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+async def test_non_finite_correction_rejected(value: float):
+    ascii = SlowASCII()
+    corrector = GuideCorrector(ascii, CORRECTIONS)  # type: ignore
+
+    with pytest.raises(GuideCorrectorError):
+        corrector.submit("offset", ra=value)
+
+    assert corrector.n_pending == 0
+    assert corrector.n_rejected == 1
+
+
+async def test_max_value():
+    ascii = SlowASCII()
+    corrector = GuideCorrector(ascii, CORRECTIONS)  # type: ignore
+
+    with pytest.raises(GuideCorrectorError):
+        corrector.submit("offset", dec=-6)
+
+    # Each correction is within the limit, but the merged sum is not.
+    first = corrector.submit("offset", ra=3)
+    with pytest.raises(GuideCorrectorError):
+        corrector.submit("offset", ra=3)
+
+    corrector.submit("offset", ra=-1)
+
+    ascii.release.set()
+    corrector.start()
+
+    assert (await first)["commands"] == ["Jog E 2.0"]
+
+    await corrector.stop()
+
+
+def test_guide_websocket_rejects_nan(client: TestClient, controller: FakeController):
+    with client.websocket_connect("/ascii/guide") as websocket:
+        websocket.send_text('{"correction": "guide", "ra": NaN}')
+        reply = websocket.receive_json()
+
+    assert reply["type"] == "error"
+    assert "Jog" not in " ".join(controller.commands)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_log.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import threading
+import time
+
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import pytest
+
+from f1_tcs import log, logger
+from f1_tcs.log import JSONLinesFormatter
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+    """Waits until the listener thread has emitted the expected records."""
+
+    t0 = time.time()
+    while not condition() and time.time() - t0 < timeout:
+        time.sleep(0.01)
+
+    return condition()
+
+
+class _ListHandler(logging.Handler):
+    """Records the messages and the thread in which they are emitted."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[str, str]] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append((record.getMessage(), threading.current_thread().name))
+
+
+@pytest.fixture()
+def timing_stream() -> Iterator[io.StringIO]:
+    """Redirects the timing log to a buffer."""
+
+    assert isinstance(log._timing_handler, logging.StreamHandler)
+
+    stream = io.StringIO()
+    previous = log._timing_handler.setStream(stream)
+
+    yield stream
+
+    log._timing_handler.setStream(previous)
+    log.set_timing_log(False)
+
+
+def test_json_lines_formatter():
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "event", (), None)
+    record.data = {"command": "Park", "elapsed": 0.1}
+
+    payload = json.loads(JSONLinesFormatter().format(record))
+
+    assert payload == {
+        "time": record.created,
+        "event": "event",
+        "command": "Park",
+        "elapsed": 0.1,
+    }
+
+
+def test_put_log_level(client: TestClient):
+    level = logger.level
+
+    response = client.put("/admin/log_level", params={"level": "WARNING"})
+    assert response.status_code == 200
+    assert response.json()["level"] == "WARNING"
+    assert logger.level == logging.WARNING
+
+    assert client.put("/admin/log_level", params={"level": "BAD"}).status_code == 422
+
+    logger.setLevel(level)
+
+
+def test_put_timing_log(client: TestClient, timing_stream: io.StringIO):
+    response = client.put("/admin/timing_log", params={"enabled": True})
+    assert response.json()["timing"] is True
+
+    client.get("/ascii/park")
+    assert _wait_for(lambda: "ascii_command" in timing_stream.getvalue())
+
+    lines = [json.loads(line) for line in timing_stream.getvalue().splitlines()]
+    park = [line for line in lines if line["command"] == "Park"]
+    assert len(park) == 1
+    assert park[0]["event"] == "ascii_command"
+    assert park[0]["pipelined"] == 1
+    assert park[0]["elapsed"] > 0
+
+    response = client.put("/admin/timing_log", params={"enabled": False})
+    assert response.json()["timing"] is False
+
+    timing_stream.truncate(0)
+    timing_stream.seek(0)
+
+    client.get("/ascii/park")
+    time.sleep(0.1)
+    assert timing_stream.getvalue() == ""
+
+
+def test_records_forwarded_to_uvicorn():
+    handler = _ListHandler()
+    uvicorn_logger = logging.getLogger("uvicorn.error")
+    uvicorn_logger.addHandler(handler)
+
+    try:
+        logger.warning("Forwarded record.")
+        assert _wait_for(lambda: len(handler.records) > 0)
+    finally:
+        uvicorn_logger.removeHandler(handler)
+
+    message, thread = handler.records[0]
+    assert message == "Forwarded record."
+
+    # The record was emitted by the listener, not by the thread that logged it.
+    assert thread != threading.current_thread().name
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_profiling.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def get_metrics(header: str) -> dict[str, float]:
+    metrics = {}
+    for item in header.split(","):
+        name, duration = item.strip().split(";dur=")
+        metrics[name] = float(duration)
+
+    return metrics
+
+
+@pytest.mark.parametrize("path", ["/ascii/park", "/ascii/sync_to_zenith"])
+def test_server_timing(client: TestClient, path: str):
+    response = client.get(path)
+    assert response.status_code == 200
+
+    metrics = get_metrics(response.headers["Server-Timing"])
+    assert set(metrics) == {"upstream", "deps", "app", "serialize", "total"}
+
+    assert metrics["upstream"] <= metrics["app"] <= metrics["total"]
+
+
+def test_server_timing_untimed_route(client: TestClient):
+    # Routes that do not use TimedRoute only report the total.
+    response = client.get("/admin/admission")
+    assert response.status_code == 200
+
+    assert get_metrics(response.headers["Server-Timing"]).keys() == {"total"}
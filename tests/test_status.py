@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_status.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+from f1_tcs import config
+from f1_tcs.status import StatusChangeDetector, StatusPoller
+from f1_tcs.tools import parse_scope_status
+
+from .conftest import PARKED_STATUS
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from .conftest import FakeController
+
+
+def test_status_stream_unsubscribes_on_disconnect(client: TestClient):
+    poller = client.app.state.status_poller  # type: ignore
+
+    with client.websocket_connect("/ascii/status/stream?mode=events") as websocket:
+        assert len(poller.subscriptions) == 1
+
+        # Nothing is sent on a quiet events stream, so the disconnection must be
+        # noticed by the receiving side.
+        websocket.close()
+
+        t0 = time.time()
+        while len(poller.subscriptions) > 0 and time.time() - t0 < 2:
+            time.sleep(0.01)
+
+        assert len(poller.subscriptions) == 0
+
+
+def _sample(mask: int, second: int) -> str:
+    """A status string after ``second`` seconds with a fixed alt/az."""
+
+    hours = second / 3600 * 1.0027379
+
+    ra = 12.5 + hours if mask & 2 == 0 else 12.5
+    lst = 12.5 + hours
+    jd = 2461000.5 + second / 86400
+
+    return f"{mask};{ra};30.0;89.9;180.0;0.0;0.0;{lst};{jd};{4 + hours};1.0;_"
+
+
+def test_status_version_parked():
+    poller = StatusPoller(
+        None,  # type: ignore
+        deadbands=config["status"]["deadbands"],
+        version_ignore=config["status"]["version_ignore"],
+    )
+
+    for second in range(60):
+        poller.process(parse_scope_status(_sample(17, second)), timestamp=second)
+
+    assert poller.version.sequence == 1
+
+    # Unparking generates events and changes the version.
+    poller.process(parse_scope_status(_sample(1, 60)), timestamp=60)
+    assert poller.version.sequence == 2
+
+
+def test_status_version_tracking():
+    poller = StatusPoller(
+        None,  # type: ignore
+        deadbands=config["status"]["deadbands"],
+        version_ignore=config["status"]["version_ignore"],
+    )
+
+    # While tracking the RA is constant but the alt/az change.
+    for second in range(0, 60, 10):
+        status = _sample(3, second).replace("89.9", f"{60 + second / 100}")
+        poller.process(parse_scope_status(status), timestamp=second)
+
+    assert poller.version.sequence == 6
+
+
+def test_status_etag(client: TestClient):
+    response = client.get("/ascii/status")
+    assert response.status_code == 200
+
+    etag = response.headers["ETag"]
+    sequence = response.json()["sequence"]
+
+    response = client.get("/ascii/status", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Nothing changes, so the long-poll times out and returns the same sample.
+    response = client.get("/ascii/status", params={"after": sequence, "timeout": 1})
+    assert response.status_code == 200
+    assert response.json()["sequence"] == sequence
+
+
+def test_status_subscription_resyncs_on_overflow():
+    poller = StatusPoller(None)  # type: ignore
+    poller.process(parse_scope_status(_sample(17, 0)), timestamp=1)
+
+    subscription = poller.subscribe("events", maxsize=3)
+    assert subscription.queue.qsize() == 1
+
+    # Toggle the parked bit more times than the subscriber can keep up with.
+    for second in range(1, 5):
+        mask = 1 if second % 2 else 17
+        poller.process(parse_scope_status(_sample(mask, second)), timestamp=second)
+
+    # The queue was replaced by a snapshot that reflects the last sample.
+    assert subscription.queue.qsize() == 2
+    assert subscription.dropped == 4
+
+    snapshot = subscription.queue.get_nowait()
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["dropped"] == 4
+    assert snapshot["status"]["bool_params"] == 1
+
+    event = subscription.queue.get_nowait()
+    assert event["type"] == "event" and event["state"] == "set"
+
+
+def test_detector_first_sample():
+    detector = StatusChangeDetector()
+
+    events, delta = detector.update(parse_scope_status(PARKED_STATUS), timestamp=0)
+
+    assert events == []
+    assert delta is None
+
+
+def test_detector_events():
+    detector = StatusChangeDetector()
+    detector.update(parse_scope_status(_sample(17, 0)))
+
+    # Unparking clears PARKED and sets TRACKING.
+    events, _ = detector.update(parse_scope_status(_sample(3, 0)), timestamp=0)
+
+    assert events == [
+        {"type": "event", "timestamp": 0, "bit": "TRACKING", "state": "set"},
+        {"type": "event", "timestamp": 0, "bit": "PARKED", "state": "cleared"},
+    ]
+
+    events, _ = detector.update(parse_scope_status(_sample(3, 0)), timestamp=1)
+    assert events == []
+
+
+def test_detector_deadbands():
+    detector = StatusChangeDetector({"altitude": 0.01})
+
+    def update(altitude: float):
+        status = PARKED_STATUS.replace("89.9", str(altitude))
+        return detector.update(parse_scope_status(status), timestamp=0)[1]
+
+    update(80.0)
+
+    # Each change is within the deadband, but the change with respect to the last
+    # reported value is not.
+    assert update(80.006) is None
+    assert update(80.012) == {
+        "type": "delta",
+        "timestamp": 0,
+        "changes": {"altitude": 80.012},
+    }
+    assert update(80.018) is None
+
+    # Fields without a deadband are reported on any change.
+    status = PARKED_STATUS.replace("180.0", "180.0001").replace("89.9", "80.018")
+    _, delta = detector.update(parse_scope_status(status))
+    assert delta is not None and delta["changes"] == {"azimuth": 180.0001}
+
+
+def test_status_stream_modes(client: TestClient, controller: FakeController):
+    poller = client.app.state.status_poller  # type: ignore
+
+    t0 = time.time()
+    while poller.latest is None and time.time() - t0 < 2:
+        time.sleep(0.01)
+
+    with (
+        client.websocket_connect("/ascii/status/stream?mode=events") as events,
+        client.websocket_connect("/ascii/status/stream?mode=deltas") as deltas,
+    ):
+        assert events.receive_json()["type"] == "snapshot"
+        assert deltas.receive_json()["type"] == "snapshot"
+
+        # Unpark and move in altitude. The next poll produces an event and a delta.
+        controller.status = PARKED_STATUS.replace("17;", "1;").replace("89.9", "80.0")
+
+        event = events.receive_json()
+        delta = deltas.receive_json()
+
+    assert event["type"] == "event"
+    assert event["bit"] == "PARKED" and event["state"] == "cleared"
+
+    assert delta["type"] == "delta"
+    assert delta["changes"] == {"altitude": 80.0}
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-19
+# @Filename: test_telemetry.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from f1_tcs.analytics import get_night_events, summarise
+from f1_tcs.telemetry import TelemetryRecorder, list_nights, load_night
+from f1_tcs.tools import parse_scope_status
+
+from .conftest import PARKED_STATUS
+
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+DAY = 86400
+
+
+def test_recorder_prunes_old_nights(tmp_path: pathlib.Path):
+    recorder = TelemetryRecorder(tmp_path, max_nights=2)
+    sample = parse_scope_status(PARKED_STATUS)
+
+    # Noon UTC, so each day is a different night.
+    for day in range(4):
+        for second in range(3):
+            recorder.record(sample, 12 * 3600 + day * DAY + second)
+        recorder.flush()
+
+    assert list_nights(tmp_path) == ["1970-01-03", "1970-01-04"]
+
+    data = load_night(recorder.get_file("1970-01-04"))
+    assert data.shape == (3, 12)
+
+
+def test_summarise_slew(tmp_path: pathlib.Path):
+    recorder = TelemetryRecorder(tmp_path)
+    parked = parse_scope_status(PARKED_STATUS)
+
+    # Two seconds slewing 10 degrees in altitude.
+    slewing = parse_scope_status(PARKED_STATUS.replace("17;", "5;", 1))
+    moved = parse_scope_status(PARKED_STATUS.replace("89.9", "79.9"))
+
+    for second, sample in enumerate([parked, slewing, slewing, moved]):
+        recorder.record(sample, 12 * 3600 + second)
+    recorder.flush()
+
+    events = get_night_events(recorder.get_file("1970-01-01"))
+    report = summarise([events])
+
+    assert report["n_samples"] == 4
+    assert report["slews"]["count"] == 1
+    assert report["slews"]["duration"]["max"] == 2
+    assert report["slews"]["by_distance"][1]["count"] == 1